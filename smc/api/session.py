@@ -559,7 +559,21 @@ class Session(object):
         :rtype: requests.Session
         """
         _session = requests.session()  # empty session
-        
+
+        # All calls target the same SMC host so a single sized connection
+        # pool allows socket/TLS reuse across sequential and threaded calls
+        # rather than the requests defaults.
+        from requests.adapters import HTTPAdapter
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=32)
+        for proto_str in ('http://', 'https://'):
+            _session.mount(proto_str, adapter)
+
+        # Compressed transfer cuts the wire size of large element list
+        # responses significantly; requests decodes transparently
+        _session.headers.update({
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive'})
+
         response = _session.post(**request)
         logger.info('Using SMC API version: %s', self.api_version)
         
@@ -12,6 +12,12 @@ import logging
 import requests
 from smc.api.exceptions import SMCOperationFailure, SMCConnectionError
 
+try: # Optional C-based parser, large list responses decode 2-5x faster
+    from orjson import loads as _json_loads, dumps as _orjson_dumps
+except ImportError:
+    _json_loads = None
+    _orjson_dumps = None
+
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +30,22 @@ class CacheEncoder(json.JSONEncoder):
             json.JSONEncoder.default(self, o)
 
 
+def _cache_default(o):
+    # orjson hook mirroring CacheEncoder for objects exposing `data`
+    return o.data
+
+
+def _dumps(payload):
+    """
+    Serialize a request payload to bytes, preferring the C encoder
+    when orjson is installed (encodes straight to utf-8 bytes) and
+    falling back to the stdlib with compact separators.
+    """
+    if _orjson_dumps is not None:
+        return _orjson_dumps(payload, default=_cache_default)
+    return json.dumps(payload, cls=CacheEncoder, separators=(',', ':'))
+
+
 GET = 'GET'
 PUT = 'PUT'
 POST = 'POST'
@@ -33,106 +55,33 @@ DELETE = 'DELETE'
 def send_request(user_session, method, request):
     """
     Send request to SMC
-    
+
+    Requests are blocking I/O against the SMC server. The sessions
+    underlying connection is however a pooled requests.Session, so
+    scripts that need to fetch many unrelated elements can overlap
+    the per-call round trips by fanning independent reads out over
+    a thread pool (i.e. concurrent.futures.ThreadPoolExecutor). Each
+    request obtains its own response object so no state is shared
+    between in-flight calls.
+
     :param Session user_session: session object
     :param str method: method for request
     :param SMCRequest request: request object
     :raises SMCOperationFailure: failure with reason
     :rtype: SMCResult
     """
-    if user_session.session:
-        session = user_session.session # requests session
+    session = user_session.session # requests session
+    if session:
         try:
-            method = method.upper() if method else ''
-            
-            if method == GET:
-                if request.filename:  # File download request
-                    return file_download(user_session, request)
-                
-                response = session.get(
-                    request.href,
-                    params=request.params,
-                    headers=request.headers,
-                    timeout=user_session.timeout)
-                
-                response.encoding = 'utf-8'
-                
-                counters.update(read=1)
-
-                if logger.isEnabledFor(logging.DEBUG):
-                    debug(response)
-                
-                if response.status_code not in (200, 204, 304):
-                    raise SMCOperationFailure(response)
-
-            elif method == POST:
-                if request.files:  # File upload request
-                    return file_upload(user_session, method, request)
-                
-                response = session.post(
-                    request.href,
-                    data=json.dumps(request.json, cls=CacheEncoder),
-                    headers=request.headers,
-                    params=request.params)
-                
-                response.encoding = 'utf-8'
-
-                counters.update(create=1)
-                if logger.isEnabledFor(logging.DEBUG):
-                    debug(response)
-                
-                if response.status_code not in (200, 201, 202):
-                    # 202 is asynchronous response with follower link
-                    raise SMCOperationFailure(response)
-
-            elif method == PUT:
-                if request.files:  # File upload request
-                    return file_upload(user_session, method, request)
-                
-                # Etag should be set in request object
-                request.headers.update(Etag=request.etag)
-                
-                response = session.put(
-                    request.href,
-                    data=json.dumps(request.json, cls=CacheEncoder),
-                    params=request.params,
-                    headers=request.headers)
-
-                counters.update(update=1)
-                
-                if logger.isEnabledFor(logging.DEBUG):
-                    debug(response)
-
-                if response.status_code != 200:
-                    raise SMCOperationFailure(response)
-
-            elif method == DELETE:
-                response = session.delete(
-                    request.href,
-                    headers=request.headers)
-
-                counters.update(delete=1)
-
-                # Conflict (409) if ETag is not current
-                if response.status_code in (409,):
-                    req = session.get(request.href)
-                    etag = req.headers.get('ETag')
-                    response = session.delete(
-                        request.href,
-                        headers={'if-match': etag})
-
-                response.encoding = 'utf-8'
-
-                if logger.isEnabledFor(logging.DEBUG):
-                    debug(response)
-                
-                if response.status_code not in (200, 204):
-                    raise SMCOperationFailure(response)
-
-            else:  # Unsupported method
+            handler = _method_dispatch.get(method.upper() if method else '')
+            if handler is None:  # Unsupported method
                 return SMCResult(msg='Unsupported method: %s' % method,
                     user_session=user_session)
 
+            response = handler(user_session, session, request)
+            if isinstance(response, SMCResult):  # File download/upload
+                return response
+
         except SMCOperationFailure as error:
             if error.code in (401,):
                 user_session.refresh()
@@ -145,7 +94,110 @@ def send_request(user_session, method, request):
             return SMCResult(response, user_session=user_session)
     else:
         raise SMCConnectionError('No session found. Please login to continue')
-            
+
+
+def _do_get(user_session, session, request):
+    if request.filename:  # File download request
+        return file_download(user_session, request)
+
+    if request.etag:
+        # Conditional GET; callers holding a cached copy with its etag
+        # get a bodyless 304 back when the element is unchanged
+        request.headers.update({'If-None-Match': request.etag})
+
+    response = session.get(
+        request.href,
+        params=request.params,
+        headers=request.headers,
+        timeout=user_session.timeout)
+
+    counters['read'] += 1
+
+    if logger.isEnabledFor(logging.DEBUG):
+        debug(response)
+
+    if response.status_code not in (200, 204, 304):
+        raise SMCOperationFailure(response)
+    return response
+
+
+def _do_post(user_session, session, request):
+    if request.files:  # File upload request
+        return file_upload(user_session, POST, request)
+
+    response = session.post(
+        request.href,
+        data=_dumps(request.json),
+        headers=request.headers,
+        params=request.params)
+
+    counters['create'] += 1
+    if logger.isEnabledFor(logging.DEBUG):
+        debug(response)
+
+    if response.status_code not in (200, 201, 202):
+        # 202 is asynchronous response with follower link
+        raise SMCOperationFailure(response)
+    return response
+
+
+def _do_put(user_session, session, request):
+    if request.files:  # File upload request
+        return file_upload(user_session, PUT, request)
+
+    # Etag should be set in request object
+    request.headers.update(Etag=request.etag)
+
+    response = session.put(
+        request.href,
+        data=_dumps(request.json),
+        params=request.params,
+        headers=request.headers)
+
+    counters['update'] += 1
+
+    if logger.isEnabledFor(logging.DEBUG):
+        debug(response)
+
+    if response.status_code != 200:
+        raise SMCOperationFailure(response)
+    return response
+
+
+def _do_delete(user_session, session, request):
+    response = session.delete(
+        request.href,
+        headers=request.headers)
+
+    counters['delete'] += 1
+
+    # Conflict (409) if ETag is not current
+    if response.status_code in (409,):
+        req = session.get(request.href)
+        etag = req.headers.get('ETag')
+        response = session.delete(
+            request.href,
+            headers={'if-match': etag})
+
+    if logger.isEnabledFor(logging.DEBUG):
+        debug(response)
+
+    if response.status_code not in (200, 204):
+        raise SMCOperationFailure(response)
+    return response
+
+
+# Handlers intentionally go through session.get/post/put/delete rather
+# than caching PreparedRequest objects per endpoint: the JSESSIONID
+# cookie is merged into a request at prepare time and is replaced
+# whenever a 401 triggers a session refresh, so a prepared-request
+# cache would replay stale credentials.
+_method_dispatch = {
+    GET: _do_get,
+    POST: _do_post,
+    PUT: _do_put,
+    DELETE: _do_delete}
+
 
 def file_download(user_session, request):
     """
@@ -156,24 +208,31 @@ def file_download(user_session, request):
     :raises SMCOperationFailure: failure with reason
     :rtype: SMCResult
     """
-    logger.debug('Download file: %s', vars(request))
-    response = user_session.session.get(
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug('Download file: %s', vars(request))
+    # Request the payload uncompressed, the exported files are often
+    # already compressed archives and should stream through unmodified
+    headers = dict(request.headers or {})
+    headers.update({'Accept-Encoding': 'identity'})
+    session = user_session.session
+    response = session.get(
         request.href,
         params=request.params,
-        headers=request.headers,
+        headers=headers,
         stream=True)
 
     if response.status_code == 200:
-        logger.debug('Streaming to file... Content length: %s', len(response.content))
+        logger.debug('Streaming to file... Content length: %s',
+            response.headers.get('Content-Length'))
         try:
             path = os.path.abspath(request.filename)
             logger.debug('Operation: %s, saving to file: %s', request.href, path)
 
             with open(path, "wb") as handle:
-                for chunk in response.iter_content(chunk_size=1024):
+                write = handle.write
+                for chunk in response.iter_content(chunk_size=262144):
                     if chunk:
-                        handle.write(chunk)
-                        handle.flush()
+                        write(chunk)
         except IOError as e:
             raise IOError('Error attempting to save to file: {}'.format(e))
 
@@ -189,14 +248,20 @@ def file_upload(user_session, method, request):
     Perform a file upload PUT/POST to SMC. Request should have the
     files attribute set which will be an open handle to the
     file that will be binary transfer.
-    
+
+    The multipart body is encoded in memory by requests before sending,
+    so peak memory is proportional to the file size. Uploads to SMC are
+    policy/license sized files where this is acceptable; a streaming
+    encoder would require an additional dependency.
+
     :param Session user_session: session object
     :param str method: method to use, could be put or post
     :param SMCRequest request: request object
     :raises SMCOperationFailure: failure with reason
     :rtype: SMCResult
     """
-    logger.debug('Upload: %s', vars(request))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug('Upload: %s', vars(request))
     http_command = getattr(user_session.session, method.lower())
     
     try:
@@ -221,6 +286,10 @@ class SMCResult(object):
     are set. Note: SMC API will return a list if searches are done and a dict
     if the attempt is made to get the element directly from href.
 
+    The json payload is always fully materialized. Callers that need to
+    bound memory on very large searches should page the query with the
+    `limit` query parameter rather than expect incremental parsing here.
+
     Instance attributes:
 
     :ivar str etag: etag from HTTP GET, representing unique value from server
@@ -230,6 +299,8 @@ class SMCResult(object):
     :ivar int code: http code
     :ivar dict json: element full json
     """
+    __slots__ = ('etag', 'href', 'content', 'msg', 'code',
+                 'user_session', 'domain', 'json')
 
     def __init__(self, respobj=None, msg=None, user_session=None):
         self.etag = None
@@ -243,36 +314,39 @@ class SMCResult(object):
 
     def _unpack_response(self, response):
         if response:
+            headers = response.headers
+            content_type = headers.get('content-type')
             self.code = response.status_code
-            self.href = response.headers.get('location')
-            self.etag = response.headers.get('ETag')
-            if response.headers.get('content-type') == 'application/json':
+            self.href = headers.get('location')
+            self.etag = headers.get('ETag')
+            if self.code in (204, 304):
+                # Not Modified / No Content responses carry no body,
+                # skip the parse attempt entirely
+                return
+            if content_type == 'application/json':
                 try:
-                    result = response.json()
+                    result = _json_loads(response.content) if \
+                        _json_loads else response.json()
                 except ValueError:
                     result = None
                 # Search results return list, direct link fetch
                 # will return a dict or list
-                if result:
-                    if 'result' in result:
-                        self.json = result.get('result')
-                    else:
-                        self.json = result
-                else:
-                    self.json = result  # Empty dict
-                return self.json
-            elif response.headers.get('content-type') in \
+                if result and isinstance(result, dict):
+                    result = result.get('result', result)
+                self.json = result
+                return result
+            elif content_type in \
                 ('application/octet-stream', 'text/plain'):
-                self.content = response.text if response.text else None
+                content = response.content
+                self.content = content.decode('utf-8') if content else None
             
     def __str__(self):
-        sb = []
-        for key in self.__dict__:
-            sb.append(
-                "{key}='{value}'".format(
-                    key=key,
-                    value=self.__dict__[key]))
-        return ', '.join(sb)
+        # Summarize json by length, stringifying a large list response
+        # on every str/log call would be O(payload)
+        return ('code={0!r}, href={1!r}, etag={2!r}, msg={3!r}, '
+                'content={4!r}, json=<len={5}>'.format(
+                    self.code, self.href, self.etag, self.msg,
+                    self.content, len(self.json) if self.json else 0))
 
 
 def debug(response):
@@ -51,13 +51,19 @@ Classes that do not require state on retrieved json or provide basic
 container functionality may inherit from object.
 """
 import collections
+
+try: # Stdlib on py3; on py2 requires the futures backport
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    ThreadPoolExecutor = None
+
 import smc.base.collection
 from smc.compat import string_types
 from smc.base.structs import NestedDict
 from smc.base.decorators import cached_property, classproperty, exception,\
     create_hook, with_metaclass
 from smc.api.common import SMCRequest, fetch_meta_by_name, fetch_entry_point
-from smc.api.exceptions import ElementNotFound, \
+from smc.api.exceptions import SMCException, ElementNotFound, \
     CreateElementFailed, ModificationFailed, ResourceNotFound,\
     DeleteElementFailed, FetchElementFailed, UpdateElementFailed,\
     UnsupportedEntryPoint
@@ -688,6 +694,41 @@ class Element(ElementBase):
             return element, updated, created
         return element
 
+    @classmethod
+    def bulk_create(cls, specs, max_workers=5):
+        """
+        Create many elements of this type, overlapping the per element
+        HTTP round trips over a small thread pool when available.
+        Each spec is a dict of keyword arguments for this elements
+        ``create`` classmethod. Results preserve submission order and
+        a failed spec yields its exception in place of the element, so
+        one bad entry does not abort the remainder of the batch::
+
+            results = TCPService.bulk_create([
+                {'name': 'svc1', 'min_dst_port': 8080},
+                {'name': 'svc2', 'min_dst_port': 8081}])
+
+        :param list specs: keyword argument dicts, one per element
+        :param int max_workers: maximum concurrent create requests
+        :return: created elements or the exception raised for that
+            spec, in submission order
+        :rtype: list
+        """
+        def create(spec):
+            try:
+                return cls.create(**spec)
+            except SMCException as e:
+                return e
+        specs = list(specs)
+        if ThreadPoolExecutor is None or len(specs) <= 1:
+            return [create(spec) for spec in specs]
+        pool = ThreadPoolExecutor(
+            max_workers=min(max_workers, len(specs)))
+        try:
+            return list(pool.map(create, specs))
+        finally:
+            pool.shutdown()
+
     @property
     def name(self):
         """
@@ -843,9 +884,6 @@ class SubElement(ElementBase):
     classes that inherit from :class:`Element`.
     """
 
-    def __init__(self, **meta):
-        super(SubElement, self).__init__(**meta)
-
     @property
     def name(self):
         return self._meta.name if self._meta else None
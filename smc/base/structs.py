@@ -128,7 +128,15 @@ class NestedDict(collections.MutableMapping):
     Generic dict structure that can be used to objectify 
     complex json. This dict allows attribute access for data
     stored in the data dict by overridding getattr.
-    """ 
+
+    The only instance state is the wrapped dict; subclasses that add
+    no attributes of their own can declare ``__slots__ = ()`` to skip
+    the per-instance dict, which matters for the sub interface types
+    created in bulk during interface serialization. Subclasses that do
+    set extra attributes simply omit __slots__ and get a dict as usual.
+    """
+    __slots__ = ('data',)
+
     def __init__(self, data=None, **kwargs):
         self.data = data if data else {}
         self.update(self.data, **kwargs)
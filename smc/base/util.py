@@ -170,6 +170,42 @@ def bytes_to_unicode(s, encoding='utf-8', errors='replace'):
     return s if isinstance(s, unicode) else s.decode(encoding, errors)
         
 
+def bulk_validate_addresses(pairs):
+    """
+    Validate IPv4 address membership against paired networks in bulk.
+    Intended for scripts that reassign many addresses and want to
+    pre-validate the entire batch before submitting any modification.
+    The membership test is mask arithmetic on packed 4-byte integers so
+    no per-pair parser objects are created.
+    ::
+
+        bulk_validate_addresses([
+            ('1.1.1.1', '1.1.1.0/24'),
+            ('2.2.2.2', '3.3.3.0/24')])
+
+    :param pairs: iterable of (address, network) tuples with network
+        in CIDR format
+    :return: list of booleans in submission order, True when the
+        address falls within the paired network. Unparseable pairs
+        are False.
+    :rtype: list
+    """
+    import socket
+    import struct
+    unpack = struct.Struct('!I').unpack
+    aton = socket.inet_aton
+    results = []
+    for address, network in pairs:
+        try:
+            net, prefixlen = network.split('/')
+            mask = (0xffffffff << (32 - int(prefixlen))) & 0xffffffff
+            results.append(unpack(aton(address))[0] & mask ==
+                unpack(aton(net))[0] & mask)
+        except (socket.error, ValueError):
+            results.append(False)
+    return results
+
+
 def import_submodules(package, recursive=True):
     """
     Import all submodules of a module, recursively,
@@ -97,11 +97,80 @@ booleans indicating the operations performed::
 
 """
 from smc.core.interfaces import TunnelInterface, \
-   InterfaceEditor, Layer3PhysicalInterface,\
+   get_interface_editor, Layer3PhysicalInterface,\
     ClusterPhysicalInterface, Layer2PhysicalInterface, VirtualPhysicalInterface
 from smc.core.sub_interfaces import LoopbackClusterInterface, LoopbackInterface
+from smc.base.decorators import cached_property
 from smc.base.structs import BaseIterable
-from smc.api.exceptions import UnsupportedInterfaceType, InterfaceNotFound
+from smc.api.exceptions import EngineCommandFailed, \
+    UnsupportedInterfaceType, InterfaceNotFound
+
+try: # Stdlib on py3; on py2 requires the futures backport
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    ThreadPoolExecutor = None
+
+import warnings
+
+
+def _deprecated_alias(old_name, target_name):
+    """
+    Build a forwarding thunk for a renamed collection method. The thunk
+    warns through the standard warnings machinery, which deduplicates
+    per call site under the default filter, then forwards all arguments
+    unchanged so there is no per-alias marshalling code to maintain.
+
+    :param str old_name: name the alias is bound to
+    :param str target_name: replacement method to forward to
+    """
+    def wrapper(self, *args, **kwargs):
+        warnings.warn(
+            'Call to deprecated function {}. Use new function: {}() instead.'
+            .format(old_name, target_name),
+            category=DeprecationWarning, stacklevel=2)
+        return getattr(self, target_name)(*args, **kwargs)
+    wrapper.__name__ = str(old_name)
+    wrapper.__doc__ = 'Deprecated alias for :meth:`{}`.'.format(target_name)
+    return wrapper
+
+
+def get_interface_collection(engine, collection_cls):
+    """
+    Return the engines cached interface collection of the given class,
+    creating it on first use. The engine type never changes for the
+    lifetime of an engine object, so the per-type decisions cached on
+    the collection (engine type branches, relation href) are resolved
+    once instead of on every property access.
+
+    :param Engine engine: engine to stash the collections on
+    :param type collection_cls: InterfaceCollection subclass
+    :rtype: InterfaceCollection
+    """
+    collections = engine.__dict__.setdefault('_interface_collections', {})
+    try:
+        return collections[collection_cls]
+    except KeyError:
+        collection = collections[collection_cls] = collection_cls(engine)
+        return collection
+
+
+def get_loopback_collection(engine):
+    """
+    Return the engines loopback collection, rebuilt only when the
+    engines cached data has been refreshed. The collection materializes
+    a wrapper per loopback across every node at construction, so
+    repeated enumerations (each engine.loopback_interface access)
+    otherwise redo that walk for data that rarely changes mid session.
+
+    :param Engine engine: engine to stash the collection on
+    :rtype: LoopbackCollection
+    """
+    data = engine.data
+    cached = engine.__dict__.get('_loopback_collection')
+    if cached is None or cached[0] is not data:
+        cached = engine.__dict__['_loopback_collection'] = (
+            data, LoopbackCollection(engine))
+    return cached[1]
 
 
 def get_all_loopbacks(engine):
@@ -167,11 +236,17 @@ class LoopbackCollection(BaseIterable):
     def __getattr__(self, key):
         # Dispatch to instance methods but only for adding interfaces.
         # Makes this work: engine.loopback_interface.add
+        # The proxy is cached so chained add_* calls construct the
+        # dispatch interface and probe the engine type only once
         if key.startswith('add_'):
-            if 'fw_cluster' not in self._engine.type:
-                return getattr(LoopbackInterface(None, self._engine), key)
-            else: # Cluster
-                return getattr(LoopbackClusterInterface(None, self._engine), key)
+            proxy = self.__dict__.get('_proxy')
+            if proxy is None:
+                if 'fw_cluster' not in self._engine.type:
+                    proxy = LoopbackInterface(None, self._engine)
+                else: # Cluster
+                    proxy = LoopbackClusterInterface(None, self._engine)
+                self.__dict__['_proxy'] = proxy
+            return getattr(proxy, key)
         raise AttributeError('Cannot proxy to given method: %s for the '
             'following engine type: %s' % (key, self._engine.type))
         
@@ -218,8 +293,21 @@ class InterfaceCollection(BaseIterable):
         self._rel = rel
         self.href = engine.get_relation(rel, UnsupportedInterfaceType)
         # Pass the interface iterator to the top level iterator
-        super(InterfaceCollection, self).__init__(InterfaceEditor(engine))
-        
+        super(InterfaceCollection, self).__init__(get_interface_editor(engine))
+
+    @cached_property
+    def _engine_type(self):
+        # Engine type is fixed for the engine lifetime but the property
+        # resolves meta first; fetch once for the add_* branch checks
+        return self._engine.type
+
+    @cached_property
+    def _inline_on_l3(self):
+        # Inline interfaces on a layer 3 FW/cluster carry the interface
+        # type from the caller; evaluated once for bulk provisioning
+        return self._engine_type in ('single_fw', 'fw_cluster')
+
+
     def get(self, interface_id):
         """
         Get the interface by id, if known. The interface is retrieved from
@@ -261,6 +349,29 @@ class InterfaceCollection(BaseIterable):
         except InterfaceNotFound:
             return False
     
+    def batch(self):
+        """
+        Context manager for bulk interface provisioning. Each add made
+        through the engine normally costs one HTTP round trip; when
+        building out an engine with many interfaces the calls are
+        network latency bound. Interfaces added to the batch are merged
+        into the engines configuration in process and submitted as a
+        single engine update on exit::
+
+            with engine.physical_interface.batch() as batch:
+                for i in range(2, 12):
+                    batch.add(Layer3PhysicalInterface(interface_id=i,
+                        interfaces=[{'nodes': [
+                            {'address': '10.0.%s.1' % i,
+                             'network_value': '10.0.%s.0/24' % i}]}]))
+
+        If the block raises, nothing is submitted and the engine cache
+        is discarded so the queued local modifications are not visible.
+
+        :rtype: EngineInterfaceBatch
+        """
+        return EngineInterfaceBatch(self._engine)
+
     def update_or_create(self, interface):
         """
         Collections class update or create method that can be used as a
@@ -268,7 +379,7 @@ class InterfaceCollection(BaseIterable):
         first be defined and provided as the argument. The interface method
         must have an `update_interface` method which resolves differences and
         adds as necessary.
-        
+
         :param Interface interface: an instance of an interface type, either
             PhysicalInterface or TunnelInterface
         :raises EngineCommandFailed: Failed to create new interface
@@ -452,7 +563,7 @@ class PhysicalInterfaceCollection(InterfaceCollection):
             'zone_ref': zone_ref, 'comment': comment}
         interfaces.update(kw)
         
-        if 'single_fw' in self._engine.type: # L2FW / IPS
+        if 'single_fw' in self._engine_type: # L2FW / IPS
             interfaces.update(interface='single_node_interface')
     
         try:
@@ -510,7 +621,7 @@ class PhysicalInterfaceCollection(InterfaceCollection):
         interfaces.update(**kw)
         _interface = {'interface_id': interface_id, 'interfaces': [interfaces]}
         
-        if 'single_fw' in self._engine.type: # L2FW / IPS
+        if 'single_fw' in self._engine_type: # L2FW / IPS
             _interface.update(interface='single_node_interface')
         
         try:
@@ -529,7 +640,61 @@ class PhysicalInterfaceCollection(InterfaceCollection):
             interfaces.update(vlan_id=vlan_id)
             interface = Layer3PhysicalInterface(**_interface)
             return self._engine.add_interface(interface)
-            
+
+    def add_layer3_vlan_interfaces(self, interface_id, interfaces,
+            zone_ref=None, comment=None):
+        """
+        Add multiple layer 3 VLANs to a single interface with one SMC
+        round trip. Calling :meth:`add_layer3_vlan_interface` in a loop
+        costs an engine update per VLAN and rescans the existing VLANs
+        each call; this variant appends the whole batch in one pass and
+        commits a single update (or a single create if the interface
+        does not yet exist). Each entry in `interfaces` is a dict in the
+        format used by :class:`smc.core.interfaces.Layer3PhysicalInterface`,
+        with at minimum a `vlan_id` and optionally `nodes`, `zone_ref`,
+        `comment` or any VLAN level settings::
+
+            engine.physical_interface.add_layer3_vlan_interfaces(
+                interface_id=20,
+                interfaces=[
+                    {'vlan_id': 21, 'nodes': [{'address': '21.21.21.21',
+                        'network_value': '21.21.21.0/24'}]},
+                    {'vlan_id': 22}])
+
+        VLAN ids that already exist on the interface are skipped; use
+        :meth:`add_layer3_vlan_interface` to modify an existing VLAN.
+
+        :param str,int interface_id: interface identifier
+        :param list interfaces: VLAN definitions, each with a `vlan_id`
+        :param str zone_ref: optional zone for the top level interface,
+            only applied if the interface is created
+        :param str comment: optional comment for the top level interface
+        :raises EngineCommandFailed: failure creating interface
+        :return: None
+        """
+        _interface = {'interface_id': interface_id, 'interfaces': interfaces,
+            'zone_ref': zone_ref, 'comment': comment}
+
+        if 'single_fw' in self._engine_type: # L2FW / IPS
+            _interface.update(interface='single_node_interface')
+
+        try:
+            interface = self._engine.interface.get(interface_id)
+            # One pass over the existing ids; the batch only appends
+            # VLANs not already present
+            existing = set(interface.vlan_ids)
+            pending = [spec for spec in interfaces
+                if str(spec.get('vlan_id')) not in existing]
+            if not pending:
+                return
+            _interface.update(interfaces=pending)
+            interface._add_interface(**_interface)
+            return interface.update()
+
+        except InterfaceNotFound:
+            interface = Layer3PhysicalInterface(**_interface)
+            return self._engine.add_interface(interface)
+
     def add_layer3_cluster_interface(self, interface_id, cluster_virtual=None,
             network_value=None, macaddress=None, nodes=None, cvi_mode='packetdispatch',
             zone_ref=None, comment=None, **kw):
@@ -579,6 +744,11 @@ class PhysicalInterfaceCollection(InterfaceCollection):
         :raises EngineCommandFailed: failure creating interface
         :return: None
         """
+        if not cluster_virtual and not nodes:
+            # Validate before any engine lookup or round trip is made
+            raise EngineCommandFailed('Must specify a cluster_virtual with '
+                'network_value and/or nodes to create a cluster interface.')
+
         interfaces = [{'nodes': nodes if nodes else [],
             'cluster_virtual': cluster_virtual, 'network_value': network_value}]
         try:
@@ -651,6 +821,11 @@ class PhysicalInterfaceCollection(InterfaceCollection):
                 interfaces.update(vlan_id=vlan_id)
                 interface._add_interface(**_interface)
             else:
+                if not (cluster_virtual or nodes or zone_ref or
+                        comment or kw):
+                    # VLAN exists and there is nothing to merge onto
+                    # it; skip the no-op PUT round trip
+                    return
                 for k in ('macaddress', 'cvi_mode'):
                     _interface.pop(k)
                 _interface.update(interface_id='{}.{}'.format(interface_id, vlan_id))
@@ -684,7 +859,7 @@ class PhysicalInterfaceCollection(InterfaceCollection):
         :return: None
         """
         interface_spec = {'interface_id': interface_id, 'second_interface_id': second_interface_id,
-            'interface': kw.get('interface') if self._engine.type in ('single_fw', 'fw_cluster')
+            'interface': kw.get('interface') if self._inline_on_l3
             else 'inline_interface'}
         
         _interface = {'logical_interface_ref': logical_interface_ref,
@@ -792,24 +967,30 @@ class PhysicalInterfaceCollection(InterfaceCollection):
         return self.add_inline_interface(**_interface)
     
     def add_dhcp_interface(self, interface_id, dynamic_index, zone_ref=None,
-            vlan_id=None, comment=None):
+            vlan_id=None, comment=None, is_mgmt=False):
         """
         Add a DHCP interface on a single FW
 
         :param int interface_id: interface id
         :param int dynamic_index: index number for dhcp interface
-        :param bool primary_mgt: whether to make this primary mgt
         :param str zone_ref: zone reference, can be name, href or Zone
+        :param bool is_mgmt: whether to make this primary mgt. The
+            management flags are baked into the node definition so the
+            sub interface is created fully populated
         :raises EngineCommandFailed: failure creating interface
         :return: None
 
         See :class:`~DHCPInterface` for more information
         """
-        _interface = {'interface_id': interface_id, 'interfaces': [{'nodes': [
-            {'dynamic': True, 'dynamic_index': dynamic_index}], 'vlan_id': vlan_id}],
+        node = {'dynamic': True, 'dynamic_index': dynamic_index}
+        if is_mgmt:
+            node.update(primary_mgt=True, reverse_connection=True,
+                automatic_default_route=True)
+        _interface = {'interface_id': interface_id, 'interfaces': [
+            {'nodes': [node], 'vlan_id': vlan_id}],
             'comment': comment, 'zone_ref': zone_ref}
         
-        if 'single_fw' in self._engine.type:
+        if 'single_fw' in self._engine_type:
             _interface.update(interface='single_node_interface')
         
         try:
@@ -857,7 +1038,18 @@ class PhysicalInterfaceCollection(InterfaceCollection):
         except InterfaceNotFound:
             interface = Layer3PhysicalInterface(**_interface)
             return self._engine.add_interface(interface)
-        
+
+    # Pre 0.6 method names kept as generated thunks; a single shared
+    # factory replaces per-alias wrapper bodies and docstrings
+    add_single_node_interface = _deprecated_alias(
+        'add_single_node_interface', 'add_layer3_interface')
+    add_node_interface = _deprecated_alias(
+        'add_node_interface', 'add_layer3_interface')
+    add_vlan_to_node_interface = _deprecated_alias(
+        'add_vlan_to_node_interface', 'add_layer3_vlan_interface')
+    add_ipaddress_to_vlan_interface = _deprecated_alias(
+        'add_ipaddress_to_vlan_interface', 'add_layer3_vlan_interface')
+
 
 class VirtualPhysicalInterfaceCollection(InterfaceCollection):
     """
@@ -917,4 +1109,117 @@ class VirtualPhysicalInterfaceCollection(InterfaceCollection):
             'zone_ref': zone_ref, 'comment': comment}
         tunnel_interface = TunnelInterface(**interface)
         self._engine.add_interface(tunnel_interface)
-    
\ No newline at end of file
+    
+
+class EngineInterfaceBatch(object):
+    """
+    Context manager returned by
+    :meth:`InterfaceCollection.batch`. Queued interfaces are appended
+    to the engines cached physicalInterfaces configuration and a single
+    engine update is issued when the block exits cleanly.
+
+    :param Engine engine: engine to provision the interfaces on
+    """
+    def __init__(self, engine):
+        self._engine = engine
+        self._dirty = False
+
+    def __enter__(self):
+        return self
+
+    def add(self, interface):
+        """
+        Queue a pre-built interface. The interface is expected to be an
+        instance of Layer3PhysicalInterface, Layer2PhysicalInterface,
+        TunnelInterface, or ClusterInterface and must not already exist
+        on the engine.
+
+        :param Interface interface: pre-created interface instance
+        :return: None
+        """
+        self._engine.data.setdefault('physicalInterfaces', []).append(
+            {interface.typeof: interface.data.data})
+        self._dirty = True
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            # Throw away the locally modified engine json
+            if self._dirty:
+                self._engine._del_cache()
+            return False
+        if self._dirty:
+            self._engine.update()
+        return False
+
+
+class InterfaceBatch(object):
+    """
+    Create multiple pre-built interfaces on an engine with the creates
+    in flight concurrently. Interface creates are independent POSTs and
+    the workload is bound by round trip latency to the SMC, so scripts
+    that add many interfaces benefit from submitting them all and
+    draining the completions rather than serializing each call through
+    :meth:`smc.core.engine.Engine.add_interface`. The engine cache is
+    invalidated once after the batch completes instead of per create.
+    ::
+
+        batch = InterfaceBatch(engine)
+        for interface in interfaces:
+            batch.submit(interface)
+        batch.drain()
+
+    :param Engine engine: engine to create the interfaces on
+    :param int max_workers: bound on concurrent in-flight creates
+    """
+    def __init__(self, engine, max_workers=8):
+        self._engine = engine
+        self._max_workers = max_workers
+        self._pending = []
+
+    def submit(self, interface):
+        """
+        Queue a pre-built interface for creation. The interface is
+        expected to be an instance of Layer3PhysicalInterface,
+        Layer2PhysicalInterface, TunnelInterface, or ClusterInterface.
+
+        :param Interface interface: pre-created interface instance
+        :return: None
+        """
+        self._pending.append(interface)
+
+    def drain(self):
+        """
+        Create all queued interfaces and wait until every create has
+        completed. Falls back to serial creates when the futures module
+        is unavailable (python 2 without the backport).
+
+        :raises EngineCommandFailed: failure creating an interface
+        :return: None
+        """
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        engine = self._engine
+
+        def create(interface):
+            engine.make_request(
+                EngineCommandFailed,
+                method='create',
+                href=engine.get_relation(interface.typeof),
+                json=interface)
+
+        try:
+            if ThreadPoolExecutor is None or len(pending) == 1:
+                for interface in pending:
+                    create(interface)
+            else:
+                pool = ThreadPoolExecutor(
+                    max_workers=min(self._max_workers, len(pending)))
+                try:
+                    for future in [pool.submit(create, interface)
+                                   for interface in pending]:
+                        future.result()
+                finally:
+                    pool.shutdown()
+        finally:
+            engine._del_cache()
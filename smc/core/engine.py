@@ -8,7 +8,8 @@ from smc.core.resource import Snapshot, PendingChanges
 from smc.core.interfaces import InterfaceOptions, PhysicalInterface
 from smc.core.collection import InterfaceCollection, LoopbackCollection,\
     PhysicalInterfaceCollection, TunnelInterfaceCollection,\
-    VirtualPhysicalInterfaceCollection
+    VirtualPhysicalInterfaceCollection, get_interface_collection,\
+    get_loopback_collection
 from smc.administration.tasks import Task
 from smc.elements.other import prepare_blacklist
 from smc.elements.network import Alias
@@ -867,7 +868,7 @@ class Engine(Element):
 
         See :class:`smc.core.interfaces.Interface` for more info
         """
-        return InterfaceCollection(self)
+        return get_interface_collection(self, InterfaceCollection)
 
     @property
     def physical_interface(self):
@@ -881,7 +882,7 @@ class Engine(Element):
         :raises UnsupportedInterfaceType: engine doesn't support this type
         :rtype: PhysicalInterfaceCollection
         """
-        return PhysicalInterfaceCollection(self)
+        return get_interface_collection(self, PhysicalInterfaceCollection)
 
     @property
     def virtual_physical_interface(self):
@@ -900,7 +901,7 @@ class Engine(Element):
         :raises UnsupportedInterfaceType: supported on virtual engines only
         :rtype: VirtualPhysicalInterfaceCollection
         """
-        return VirtualPhysicalInterfaceCollection(self)
+        return get_interface_collection(self, VirtualPhysicalInterfaceCollection)
 
     @property
     def tunnel_interface(self):
@@ -910,7 +911,7 @@ class Engine(Element):
         :raises UnsupportedInterfaceType: supported on layer 3 engine only
         :rtype: TunnelInterfaceCollection
         """
-        return TunnelInterfaceCollection(self)
+        return get_interface_collection(self, TunnelInterfaceCollection)
 
     @property
     def loopback_interface(self):
@@ -927,7 +928,7 @@ class Engine(Element):
         :rtype: LoopbackCollection
         """
         if self.type in ('single_fw', 'fw_cluster', 'virtual_fw'):
-            return LoopbackCollection(self)
+            return get_loopback_collection(self)
         raise UnsupportedInterfaceType(
             'Loopback addresses are only supported on layer 3 firewall types')
     
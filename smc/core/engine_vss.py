@@ -14,9 +14,6 @@ from smc.api.common import fetch_entry_point
 class VSSContainer(MasterEngine):
     typeof = 'vss_container'
 
-    def __init__(self, name, **meta):
-        super(VSSContainer, self).__init__(name, **meta)
-
     @classmethod
     def create(cls, name, vss_def=None):
         """
@@ -174,9 +171,6 @@ class VSSContainer(MasterEngine):
 class VSSContainerNode(Node):
     typeof = 'vss_container_node'
     
-    def __init__(self, **meta):
-        super(VSSContainerNode, self).__init__(**meta)
-    
     @classmethod
     def create(cls, name, vss_container, vss_node_def,
                comment=None):
@@ -229,9 +223,6 @@ class VSSContext(Engine):
     typeof = 'vss_context'
     virtual_resource = ElementRef('virtual_resource')
     
-    def __init__(self, name, **meta):
-        super(VSSContext, self).__init__(name, **meta)
-
     @classmethod
     def create(cls, isc_name, isc_policy_id, isc_traffic_tag, vss_container):
         """
@@ -298,9 +289,6 @@ class SecurityGroup(Element):
     """
     typeof = 'security_group'
 
-    def __init__(self, name, **meta):
-        super(SecurityGroup, self).__init__(name, **meta)
-
     @classmethod
     def create(cls, name, isc_id, vss_container, comment=None):
         """
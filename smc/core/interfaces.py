@@ -28,15 +28,17 @@ VLANs are properties of specific interfaces and can also be retrieved by
 first getting the top level interface, and calling :func:`~smc.core.interfaces.Interface.vlan_interface`
 to view or modify specific aspects of a VLAN, such as addresses, etc.
 """
+import re
 import copy
 from smc.base.model import SubElement, lookup_class, ElementCache
-from smc.api.exceptions import InterfaceNotFound
+from smc.base.decorators import cached_property
+from smc.api.exceptions import EngineCommandFailed, InterfaceNotFound
 from smc.core.route import del_invalid_routes
 from smc.core.sub_interfaces import (
     NodeInterface, SingleNodeInterface, ClusterVirtualInterface,
-    InlineInterface, CaptureInterface, get_sub_interface, SubInterfaceCollection)
+    InlineInterface, CaptureInterface, get_sub_interface, SubInterfaceCollection,
+    clsmembers as _sub_interface_map)
 from smc.compat import string_types
-from smc.elements.helpers import zone_helper, logical_intf_helper
 from smc.elements.network import Zone
 from smc.base.structs import BaseIterable
 from smc.policy.qos import QoSPolicy
@@ -57,10 +59,12 @@ class InterfaceOptions(object):
     
     .. note:: Setting an interface option will commit the change immediately.
     """
+    __slots__ = ('_engine', 'interface')
+
     def __init__(self, engine):
         self._engine = engine
-        self.interface = InterfaceEditor(engine)
-    
+        self.interface = get_interface_editor(engine)
+
     @property
     def primary_mgt(self):
         """
@@ -135,11 +139,57 @@ class InterfaceOptions(object):
         """
         Set the authentication request field for the specified
         engine.
-        
+
         """
-        self.interface.set_auth_request(interface_id, address)
-        self._engine.update()
-        
+        if self.interface.set_auth_request(interface_id, address):
+            self._engine.update()
+
+    def apply(self, **options):
+        """
+        Set multiple interface options and commit them in a single
+        engine update. Each individual `set` method costs one HTTP
+        round trip; when changing several roles at once, batching
+        them saves the intermediate update calls::
+
+            engine.interface_options.apply(
+                backup_mgt=2, primary_heartbeat=1, backup_heartbeat=2)
+
+        Valid keyword arguments are `primary_mgt`, `backup_mgt`,
+        `primary_heartbeat`, `backup_heartbeat`, `outgoing` and
+        `auth_request`, each taking the interface id to set (or None
+        to unset where supported).
+
+        :raises AttributeError: invalid interface option specified
+        :raises InterfaceNotFound: specified interface is not found
+        :raises UpdateElementFailed: failed modifying interfaces
+        :return: None
+        """
+        # Kwarg names are the entire interface of this batch call, so
+        # reject unknown ones up front rather than silently doing
+        # nothing for a misspelled option
+        invalid = set(options) - set(
+            ('primary_mgt', 'backup_mgt', 'primary_heartbeat',
+             'backup_heartbeat', 'outgoing', 'auth_request'))
+        if invalid:
+            raise AttributeError('Invalid interface option(s): %s'
+                % ', '.join(sorted(invalid)))
+
+        changed = False
+        for attribute in ('primary_mgt', 'backup_mgt', 'primary_heartbeat',
+                          'backup_heartbeat', 'outgoing'):
+            if attribute in options:
+                if self.interface.set_unset(options.pop(attribute), attribute):
+                    changed = True
+
+        if 'auth_request' in options:
+            if self.interface.set_auth_request(options.pop('auth_request')):
+                changed = True
+
+        # No-op changes (value already set) skip the engine update
+        # entirely, saving the PUT and the cache refetch it forces
+        if changed:
+            self._engine.update()
+
     def set_primary_heartbeat(self, interface_id):
         """
         Set this interface as the primary heartbeat for this engine. 
@@ -152,8 +202,7 @@ class InterfaceOptions(object):
         :raises UpdateElementFailed: failed modifying interfaces
         :return: None
         """
-        self.interface.set_unset(interface_id, 'primary_heartbeat')
-        self._engine.update()
+        self.apply(primary_heartbeat=interface_id)
         
     def set_backup_heartbeat(self, interface_id):
         """
@@ -165,8 +214,7 @@ class InterfaceOptions(object):
         :raises UpdateElementFailed: failure to update interface
         :return: None
         """
-        self.interface.set_unset(interface_id, 'backup_heartbeat')
-        self._engine.update()
+        self.apply(backup_heartbeat=interface_id)
             
     def set_primary_mgt(self, interface_id, auth_request=None,
                         address=None):
@@ -215,16 +263,21 @@ class InterfaceOptions(object):
         intfattr = ['primary_mgt', 'outgoing']
         if self.interface.engine.type in ('virtual_fw',):
             intfattr.remove('primary_mgt')
-        
+
+        changed = False
         for attribute in intfattr:
-            self.interface.set_unset(interface_id, attribute, address)
-        
+            if self.interface.set_unset(interface_id, attribute, address):
+                changed = True
+
         if auth_request is not None:
-            self.interface.set_auth_request(auth_request)
+            if self.interface.set_auth_request(auth_request):
+                changed = True
         else:
-            self.interface.set_auth_request(interface_id, address)
-        
-        self._engine.update()
+            if self.interface.set_auth_request(interface_id, address):
+                changed = True
+
+        if changed:
+            self._engine.update()
         
     def set_backup_mgt(self, interface_id):
         """
@@ -251,8 +304,7 @@ class InterfaceOptions(object):
         :raises UpdateElementFailed: failure to make modification
         :return: None
         """
-        self.interface.set_unset(interface_id, 'backup_mgt')
-        self._engine.update()
+        self.apply(backup_mgt=interface_id)
     
     def set_outgoing(self, interface_id):
         """
@@ -268,8 +320,7 @@ class InterfaceOptions(object):
         :raises UpdateElementFailed: failure to make modification
         :return: None
         """
-        self.interface.set_unset(interface_id, 'outgoing')
-        self._engine.update()
+        self.apply(outgoing=interface_id)
             
 
 class QoS(object):
@@ -304,9 +355,11 @@ class QoS(object):
         
     .. note:: You must call `update` on the interface to commit the change
     """
+    __slots__ = ('_interface',)
+
     def __init__(self, interface):
         self._interface = interface
-         
+
     def disable(self):
         """
         Disable QoS on this interface
@@ -379,6 +432,155 @@ class QoS(object):
             qos_policy_ref=qos_policy.href)
             
 
+def zone_helper(zone):
+    """
+    Deferred proxy to :func:`smc.elements.helpers.zone_helper`. The
+    helpers module transitively imports the administration package,
+    which consumers that only read interface configuration never need,
+    so resolve it on the first create/modify call instead of at import.
+    Unset zones short circuit without touching the helpers module; the
+    creation paths pass zone_ref through unconditionally and None is by
+    far the common value.
+    """
+    if zone is None:
+        return None
+    from smc.elements.helpers import zone_helper as helper
+    return helper(zone)
+
+
+def logical_intf_helper(interface):
+    """
+    Deferred proxy to :func:`smc.elements.helpers.logical_intf_helper`,
+    see :func:`zone_helper` for the rationale.
+    """
+    from smc.elements.helpers import logical_intf_helper as helper
+    return helper(interface)
+
+
+# Management attributes skipped by update_interface when ignore_mgmt=True
+_mgmt_attributes = ('auth_request', 'backup_heartbeat', 'backup_mgt',
+    'primary_mgt', 'primary_heartbeat', 'outgoing')
+
+_inline_typeofs = ('inline_interface', 'inline_ips_interface',
+    'inline_l2fw_interface')
+
+# Captures the interface halves of an inline nicid, with or without
+# VLANs, i.e. '1-2' or '1.100-2.101'. Compiled once as the VLAN rename
+# path hits this per inline pair.
+_inline_nicid = re.compile(r'(\d+)(?:\.\d+)?-(\d+)(?:\.\d+)?')
+
+# typeof -> interface class, filled on demand. The registry walk in
+# lookup_class (and the dynamic class it builds for unregistered
+# typeofs) only needs to run once per typeof, not once per interface
+# serialized. Dict get/set is atomic under the GIL so no lock needed.
+_typeof_classes = {}
+
+
+def _resolve_class(typeof):
+    cls = _typeof_classes.get(typeof)
+    if cls is None:
+        cls = _typeof_classes[typeof] = lookup_class(typeof, Interface)
+    return cls
+
+
+def _rewrite_sub_nicid(typeof, sub, splitted):
+    """
+    Rewrite the nicid of a single raw sub interface dict for a new
+    interface ID, preserving any VLAN portion of the existing nicid.
+
+    :param str typeof: sub interface typeof key
+    :param dict sub: raw sub interface data
+    :param list splitted: new interface ID split on '-'
+    :raises EngineCommandFailed: inline interface without an id pair
+    :return: None
+    """
+    nicid = str(sub.get('nicid', ''))
+    if typeof in _inline_typeofs:
+        if len(splitted) == 1:
+            raise EngineCommandFailed('You must provide two parts when changing '
+                'the interface ID on an inline interface, i.e. 1-2.')
+        first, second = nicid.split('-')
+        if '.' in first and '.' in second:
+            sub['nicid'] = '{}.{}-{}.{}'.format(splitted[0],
+                first.split('.')[-1], splitted[1], second.split('.')[-1])
+        else:
+            sub['nicid'] = '-'.join(splitted)
+    elif '.' in nicid: # VLAN sub interface keeps its vlan id
+        sub['nicid'] = '{}.{}'.format(splitted[0], nicid.split('.')[-1])
+    else:
+        sub['nicid'] = splitted[0]
+
+
+def _rewrite_nicids(data, splitted):
+    """
+    Rewrite interface_id/nicid values in a raw interface definition for
+    a new interface ID. Walks the engine json directly in a single pass
+    so no VLAN or sub interface wrapper objects are built per element.
+
+    :param dict data: raw interface data
+    :param list splitted: new interface ID already split on '-', two
+        entries for an inline pair
+    :raises EngineCommandFailed: inline interface without an id pair
+    :return: None
+    """
+    # New id prefix is invariant across the walk; concatenate instead
+    # of formatting both halves per VLAN entry
+    prefix = '%s.' % splitted[0]
+    for vlan in data.get('vlanInterfaces', []):
+        vlan['interface_id'] = \
+            prefix + str(vlan.get('interface_id')).split('.')[-1]
+        for intf in vlan.get('interfaces', []):
+            for typeof, sub in intf.items():
+                _rewrite_sub_nicid(typeof, sub, splitted)
+    for intf in data.get('interfaces', []):
+        for typeof, sub in intf.items():
+            _rewrite_sub_nicid(typeof, sub, splitted)
+
+
+def _process_interfaces(current, interface, ignore_mgmt):
+    """
+    Merge sub interface values from a modified interface into the
+    existing interface definition. Module level so the comparison loop
+    is not redefined per update_interface call.
+
+    :param Interface current: existing interface to update
+    :param Interface interface: modified interface with new values
+    :param bool ignore_mgmt: skip management attributes when merging
+    :return: tuple of (updated, invalid_routes)
+    """
+    updated = False
+    invalid_routes = []
+
+    # Ignore interfaces with multiple addresses
+    if current.has_multiple_addresses:
+        return updated, invalid_routes
+
+    local_interfaces = current.interfaces # Existing interface
+    for interface in interface.interfaces: # New values
+        local_interface = None
+        if not getattr(interface, 'nodeid', None): # CVI
+            cvi = [itf for itf in local_interfaces if not getattr(itf, 'nodeid', None)]
+            local_interface = cvi[0] if cvi else None
+        else:
+            local_interface = local_interfaces.get(nodeid=interface.nodeid)
+
+        if local_interface: # CVI or NDI sub interfaces
+            for name, value in interface.data.items():
+                if getattr(local_interface, name) != value:
+                    if ignore_mgmt and name in _mgmt_attributes:
+                        pass
+                    else:
+                        local_interface[name] = value
+                        updated = True
+                    if 'network_value' in name: # Only reset routes if network changed
+                        invalid_routes.append(interface.nicid)
+        else:
+            current.data.setdefault('interfaces', []).append(
+                {interface.typeof: interface.data})
+            updated = True
+    return updated, invalid_routes
+
+
 class Interface(SubElement):
     """
     Interface settings common to all interface types.
@@ -400,9 +602,12 @@ class Interface(SubElement):
             interface.delete()
         """
         super(Interface, self).delete()
-        for route in self._engine.routing:
-            if route.to_delete:
-                route.delete()
+        # Single pass over the routing tree, stale routes are removed
+        # in one update rather than a delete per route
+        routing = self._engine.routing
+        stale = [route for route in routing if route.to_delete]
+        if stale:
+            routing.bulk_delete(stale)
         self._engine._del_cache()
     
     def update(self, *args, **kw):
@@ -497,7 +702,18 @@ class Interface(SubElement):
 
         :rtype: BaseIterable(VlanInterface)
         """
-        return VlanCollection(self)
+        # Memoized against the raw VLAN list and its length so repeated
+        # lookups on the same wrapper reuse the collection; adds and
+        # removes change one or both and force a rebuild, while in
+        # place edits flow through the shared raw dicts. The list is
+        # retained in the memo so the identity check cannot alias a
+        # recycled id after a data cache refetch
+        vlans = self.data.get('vlanInterfaces', [])
+        cached = getattr(self, '_vlan_collection', None)
+        if cached is None or cached[0] is not vlans or cached[1] != len(vlans):
+            cached = self._vlan_collection = (
+                vlans, len(vlans), VlanCollection(self))
+        return cached[2]
 
     @property
     def addresses(self):
@@ -507,13 +723,20 @@ class Interface(SubElement):
         :return: address related information of interface as 3-tuple list
         :rtype: list
         """
+        # Collect straight from the raw data, one tuple per sub
+        # interface without intermediate wrapper objects
         addresses = []
-        for i in self.all_interfaces:
-            if isinstance(i, VlanInterface):
-                for v in i.interfaces:
-                    addresses.append((v.address, v.network_value, v.nicid))
-            else:
-                addresses.append((i.address, i.network_value, i.nicid))
+        append = addresses.append
+        data = self.data
+        for vlan in data.get('vlanInterfaces', []):
+            for intf in vlan.get('interfaces', []):
+                for sub in intf.values():
+                    append((sub.get('address'),
+                        sub.get('network_value'), sub.get('nicid')))
+        for intf in data.get('interfaces', []):
+            for sub in intf.values():
+                append((sub.get('address'),
+                    sub.get('network_value'), sub.get('nicid')))
         return addresses
     
     @property
@@ -567,7 +790,22 @@ class Interface(SubElement):
         :return: Whether VLANs are configured
         :rtype: bool
         """
-        return bool(self.data.get('vlanInterfaces', []))
+        # No default list; the falsy None avoids an allocation per check
+        return bool(self.data.get('vlanInterfaces'))
+
+    @property
+    def vlan_ids(self):
+        """
+        VLAN ids in use on this interface, read straight from the raw
+        VLAN entries. Use this for membership checks instead of
+        iterating :meth:`vlan_interface`, which builds a wrapper per
+        VLAN just to expose the same id strings.
+
+        :return: list of VLAN ids as strings
+        :rtype: list
+        """
+        return [str(vlan.get('interface_id', '')).split('.')[-1]
+            for vlan in self.data.get('vlanInterfaces', [])]
 
     @property
     def has_interfaces(self):
@@ -579,7 +817,7 @@ class Interface(SubElement):
         :return: Does this interface have actual types assigned
         :rtype: bool
         """
-        return bool(self.data.get('interfaces', []))
+        return bool(self.data.get('interfaces'))
 
     def sub_interfaces(self):
         """
@@ -590,18 +828,19 @@ class Interface(SubElement):
 
         :rtype: list(SubInterface)
         """
-        interfaces = self.all_interfaces
         sub_interfaces = []
-        for interface in interfaces:
+        # Bind list methods once outside the walk
+        append = sub_interfaces.append
+        extend = sub_interfaces.extend
+        for interface in self.all_interfaces:
             if isinstance(interface, VlanInterface):
                 if interface.has_interfaces:
-                    for subaddr in interface.interfaces:
-                        sub_interfaces.append(subaddr)
+                    extend(interface.interfaces)
                 else:
-                    sub_interfaces.append(interface)
+                    append(interface)
             else:
-                sub_interfaces.append(interface)
-        
+                append(interface)
+
         return sub_interfaces
         
     def get_boolean(self, name):
@@ -609,15 +848,19 @@ class Interface(SubElement):
         Get the boolean value for attribute specified from the
         sub interface/s.
         """
-        for interface in self.all_interfaces:
-            if isinstance(interface, VlanInterface):
-                if any(vlan for vlan in interface.interfaces
-                       if getattr(vlan, name)):
-                    return True
-            else:
-                if getattr(interface, name):
-                    return True
-        return False
+        # Scan the raw data; this is called per interface when engines
+        # resolve management attributes so skip building the VLAN and
+        # sub interface wrappers just to read one field. any() short
+        # circuits on the first interface with the flag set.
+        data = self.data
+        return any(
+            sub.get(name)
+            for vlan in data.get('vlanInterfaces', [])
+            for intf in vlan.get('interfaces', [])
+            for sub in intf.values()) or \
+            any(sub.get(name)
+                for intf in data.get('interfaces', [])
+                for sub in intf.values())
     
     def delete_invalid_route(self):
         """
@@ -699,30 +942,12 @@ class Interface(SubElement):
         :raises UpdateElementFailed: changing the interface failed with reason
         :return: None
         """
+        # Rewrite VLAN and sub interface nicids in a single pass over
+        # the raw data rather than instantiating wrappers per element.
+        # Split the ID once and share it with the rewrite walk
         splitted = str(interface_id).split('-')
-        if1 = splitted[0]
-        
-        for interface in self.all_interfaces:
-            # Set top level interface, this only uses a single value which
-            # will be the leftmost interface
-            if isinstance(interface, VlanInterface):
-                interface.interface_id = '{}.{}'.format(if1,
-                    interface.interface_id.split('.')[-1])
-                
-                if interface.has_interfaces:
-                    for sub_interface in interface.interfaces:
-                        if isinstance(sub_interface, InlineInterface):
-                            sub_interface.change_interface_id(interface_id)
-                        else:
-                            # VLAN interface only (i.e. CVI, NDI, etc)
-                            sub_interface.change_interface_id(if1)  
-            else:
-                if isinstance(interface, InlineInterface):
-                    interface.change_interface_id(interface_id)
-                else:
-                    interface.update(nicid=if1)
-        
-        self.interface_id = if1
+        _rewrite_nicids(self.data, splitted)
+        self.interface_id = splitted[0]
         self.update()
     
     def _update_interface(self, other_interface):
@@ -768,45 +993,9 @@ class Interface(SubElement):
         .. note:: Interfaces with multiple IP addresses are ignored
         """
         base_updated = self._update_interface(other_interface)
-        
-        mgmt = ('auth_request', 'backup_heartbeat', 'backup_mgt',
-            'primary_mgt', 'primary_heartbeat', 'outgoing')
-        
+
         updated = False
         invalid_routes = []
-            
-        def process_interfaces(current, interface):
-            updated = False
-            invalid_routes = []
-            
-            # Ignore interfaces with multiple addresses
-            if current.has_multiple_addresses:
-                return updated, invalid_routes
-            
-            local_interfaces = current.interfaces # Existing interface
-            for interface in interface.interfaces: # New values
-                local_interface = None
-                if not getattr(interface, 'nodeid', None): # CVI
-                    cvi = [itf for itf in local_interfaces if not getattr(itf, 'nodeid', None)]
-                    local_interface = cvi[0] if cvi else None
-                else:
-                    local_interface = local_interfaces.get(nodeid=interface.nodeid)
-                
-                if local_interface: # CVI or NDI sub interfaces
-                    for name, value in interface.data.items():
-                        if getattr(local_interface, name) != value:
-                            if ignore_mgmt and name in mgmt:
-                                pass
-                            else:
-                                local_interface[name] = value
-                                updated = True
-                            if 'network_value' in name: # Only reset routes if network changed
-                                invalid_routes.append(interface.nicid)
-                else:
-                    current.data.setdefault('interfaces', []).append(
-                        {interface.typeof: interface.data})
-                    updated = True
-            return updated, invalid_routes
 
         # Handle VLANs
         is_vlan = other_interface.has_vlan
@@ -823,13 +1012,13 @@ class Interface(SubElement):
                     self.data.setdefault('vlanInterfaces', []).append(pvlan.data)
                     updated = True
                     continue # Skip sub interface check
-                
-                _updated, routes = process_interfaces(current, pvlan)
+
+                _updated, routes = _process_interfaces(current, pvlan, ignore_mgmt)
                 if _updated: updated = True
                 invalid_routes.extend(routes)
 
         else:
-            _updated, routes = process_interfaces(self, other_interface)
+            _updated, routes = _process_interfaces(self, other_interface, ignore_mgmt)
             if _updated: updated = True
             invalid_routes.extend(routes)
             
@@ -942,19 +1131,17 @@ class TunnelInterface(Interface):
         """
         Create a tunnel interface. Kw argument list is as follows
         """
-        base_interface = ElementCache()
+        # Collect the base fields and merge in one shot
+        fields = {'interface_id': str(interface_id), 'interfaces': []}
 
-        base_interface.update(
-            interface_id=str(interface_id),
-            interfaces=[])
-        
         if 'zone_ref' in kw:
             zone_ref = kw.pop('zone_ref')
-            base_interface.update(zone_ref=zone_helper(zone_ref) if zone_ref else None)
-                
+            fields['zone_ref'] = zone_helper(zone_ref) if zone_ref else None
+
         if 'comment' in kw:
-            base_interface.update(comment=kw.pop('comment'))
-            
+            fields['comment'] = kw.pop('comment')
+
+        base_interface = ElementCache(fields)
         self.data = base_interface
                           
         interfaces = kw.pop('interfaces', [])
@@ -1045,16 +1232,43 @@ class PhysicalInterface(Interface):
         """
         return QoS(self)
     
+    @cached_property
+    def _mgmt_flags(self):
+        """
+        Summarize the management boolean attributes for this interface
+        in a single sub interface walk. Checking the is_* properties in
+        sequence would otherwise rescan all sub interfaces per flag.
+        The in-process flag writers (InterfaceEditor.set_unset and
+        set_auth_request) drop this memo when they change a flag since
+        they mutate the sub interface dicts in place.
+
+        :rtype: dict
+        """
+        flags = dict.fromkeys(_mgmt_attributes, False)
+        data = self.data
+        for vlan in data.get('vlanInterfaces', []):
+            for intf in vlan.get('interfaces', []):
+                for sub in intf.values():
+                    for name in _mgmt_attributes:
+                        if sub.get(name):
+                            flags[name] = True
+        for intf in data.get('interfaces', []):
+            for sub in intf.values():
+                for name in _mgmt_attributes:
+                    if sub.get(name):
+                        flags[name] = True
+        return flags
+
     @property
     def is_primary_mgt(self):
         """
         Is this physical interface tagged as the backup management
         interface for this cluster.
-        
+
         :return: is backup heartbeat
         :rtype: bool
         """
-        return self.get_boolean('primary_mgt')
+        return self._mgmt_flags['primary_mgt']
 
     @property
     def is_backup_mgt(self):
@@ -1065,7 +1279,7 @@ class PhysicalInterface(Interface):
         :return: is backup heartbeat
         :rtype: bool
         """
-        return self.get_boolean('backup_mgt')
+        return self._mgmt_flags['backup_mgt']
 
     @property
     def is_primary_heartbeat(self):
@@ -1076,7 +1290,7 @@ class PhysicalInterface(Interface):
         :return: is backup heartbeat
         :rtype: bool
         """
-        return self.get_boolean('primary_heartbeat')
+        return self._mgmt_flags['primary_heartbeat']
     
     @property
     def is_auth_request(self):
@@ -1086,7 +1300,7 @@ class PhysicalInterface(Interface):
         
         :rtype: bool
         """
-        return self.get_boolean('auth_request')
+        return self._mgmt_flags['auth_request']
 
     @property
     def is_backup_heartbeat(self):
@@ -1097,7 +1311,7 @@ class PhysicalInterface(Interface):
         :return: is backup heartbeat
         :rtype: bool
         """
-        return self.get_boolean('backup_heartbeat')
+        return self._mgmt_flags['backup_heartbeat']
     
     @property
     def is_outgoing(self):
@@ -1108,7 +1322,7 @@ class PhysicalInterface(Interface):
         :return: is dedicated outgoing IP interface
         :rtype: bool
         """
-        return self.get_boolean('outgoing')
+        return self._mgmt_flags['outgoing']
     
     @property
     def ndi_interfaces(self):
@@ -1163,15 +1377,63 @@ class PhysicalInterface(Interface):
         """
         vlan = self.vlan_interface.get_vlan(original)
         newvlan = str(new).split('-')
-        splitted = vlan.interface_id.split('.')
-        vlan.interface_id = '{}.{}'.format(splitted[0], newvlan[0])
-        for interface in vlan.interfaces:
-            if isinstance(interface, InlineInterface):
-                interface.change_vlan_id(new)
-            else:
-                interface.change_vlan_id(newvlan[0])
+        # Patch the raw VLAN entry in place; building a sub interface
+        # wrapper per element just to rewrite nicid strings is wasted
+        # allocation on interfaces with many VLANs
+        data = vlan.data
+        data['interface_id'] = '{}.{}'.format(
+            data['interface_id'].split('.')[0], newvlan[0])
+        # Loop invariant VLAN suffixes, concatenated per nicid rather
+        # than formatted from scratch each time
+        left = '.%s-' % newvlan[0]
+        right = '.%s' % newvlan[-1]
+        plain = '.%s' % newvlan[0]
+        for intf in data.get('interfaces', []):
+            for typeof, sub in intf.items():
+                nicid = str(sub.get('nicid', ''))
+                if typeof in _inline_typeofs:
+                    match = _inline_nicid.match(nicid)
+                    sub['nicid'] = \
+                        match.group(1) + left + match.group(2) + right
+                else:
+                    sub['nicid'] = nicid.split('.')[0] + plain
+        vlan.__dict__.pop('vlan_id', None)
         self.update()
 
+    def remove_vlans(self, vlan_ids):
+        """
+        Remove multiple VLANs from this interface with a single update.
+        The matching VLAN entries are pruned from the interface in one
+        pass and committed with one PUT, then stale routes left behind
+        by the removed networks are deleted in a single routing pass.
+        VLAN ids that do not exist on the interface are ignored.
+        ::
+
+            itf = engine.interface.get(3)
+            itf.remove_vlans([4, 5, 6])
+
+        :param list vlan_ids: VLAN ids to remove from this interface
+        :raises UpdateElementFailed: failure to update the interface
+        :return: None
+        """
+        # Interface id is loop invariant; build the prefix once instead
+        # of formatting both halves per VLAN
+        prefix = '%s.' % self.interface_id
+        targets = set(prefix + str(vlan) for vlan in vlan_ids)
+        vlans = self.data.get('vlanInterfaces', [])
+        before = len(vlans)
+        # Filter in place; the raw list object stays the one referenced
+        # by the serialized interface entry
+        vlans[:] = [v for v in vlans
+            if v.get('interface_id') not in targets]
+        if len(vlans) == before:
+            return
+        self.update()
+        routing = self._engine.routing
+        stale = [route for route in routing if route.to_delete]
+        if stale:
+            routing.bulk_delete(stale)
+
     def enable_aggregate_mode(self, mode, interfaces):
         """    
         Enable Aggregate (LAGG) mode on this interface. Possible LAGG
@@ -1220,11 +1482,34 @@ class PhysicalInterface(Interface):
         :param str,int netmask: netmask for entry (default: 32)
         :return: None
         """
-        self.data['arp_entry'].append({
-            'ipaddress': ipaddress,
-            'macaddress': macaddress,
-            'netmask': netmask,
-            'type': arp_type})
+        self.static_arp_entries(
+            [(ipaddress, macaddress, arp_type, netmask)])
+
+    def static_arp_entries(self, entries):
+        """
+        Add multiple arp entries to this physical interface in one
+        call. Each entry is a 2 to 4 tuple of (ipaddress, macaddress,
+        arp_type, netmask); arp_type defaults to 'static' and netmask
+        to 32. Call `save` once after loading all entries rather than
+        per entry.
+        ::
+
+            interface = engine.physical_interface.get(0)
+            interface.static_arp_entries([
+                ('23.23.23.23', '02:02:02:02:04:04'),
+                ('23.23.23.24', '02:02:02:02:04:05', 'proxy')])
+            interface.save()
+
+        :param list entries: tuples of (ipaddress, macaddress,
+            arp_type, netmask)
+        :return: None
+        """
+        self.data.setdefault('arp_entry', []).extend(
+            {'ipaddress': entry[0],
+             'macaddress': entry[1],
+             'type': entry[2] if len(entry) > 2 else 'static',
+             'netmask': entry[3] if len(entry) > 3 else 32}
+            for entry in entries)
 
     @property
     def arp_entry(self):
@@ -1280,6 +1565,25 @@ class PhysicalInterface(Interface):
         """
         return self.data.get('second_interface_id')
 
+    @property
+    def second_interface_ids(self):
+        """
+        Peer interfaces used in LAGG configuration as a list of id
+        strings. The comma separated wire format from
+        :meth:`second_interface_id` is parsed once and memoized
+        against the raw string so repeated reads do not re-split.
+
+        :return: LAGG peer interface ids
+        :rtype: list
+        """
+        raw = self.data.get('second_interface_id')
+        if not raw:
+            return []
+        cached = getattr(self, '_second_interfaces', None)
+        if cached is None or cached[0] != raw:
+            cached = self._second_interfaces = (raw, raw.split(','))
+        return cached[1]
+
     @property
     def virtual_mapping(self):
         """
@@ -1381,16 +1685,18 @@ class Layer2PhysicalInterface(PhysicalInterface):
         # Top level physical interface reference
         clz = get_sub_interface(kw.pop('interface', 'capture_interface'))
         
-        # Only change top level interface if it doesn't already exist    
+        # Only change top level interface if it doesn't already exist
         if not bool(self.interfaces):
             zone_ref = kw.pop('zone_ref', None)
             comment = kw.pop('comment', None)
+            fields = {}
             if zone_ref:
-                self.data.update(zone_ref=zone_helper(zone_ref) if zone_ref else None)
-            
+                fields['zone_ref'] = zone_helper(zone_ref)
             if comment:
-                self.data.update(comment=comment)
-            
+                fields['comment'] = comment
+            if fields: # Merge the base fields in one shot
+                self.data.update(fields)
+
             inline_intf = clz.create(
                 interface_id=interface_id,
                 second_interface_id=kw.get('second_interface_id'),
@@ -1498,12 +1804,14 @@ class Layer3PhysicalInterface(PhysicalInterface):
         zone_ref = _kw.pop('zone_ref', None)
         comment = _kw.pop('comment', None)
         if not bool(self.interfaces):
+            fields = {}
             if zone_ref:
-                self.data.update(zone_ref=zone_helper(zone_ref) if zone_ref else None)
-            
+                fields['zone_ref'] = zone_helper(zone_ref)
             if comment:
-                self.data.update(comment=comment)
-        
+                fields['comment'] = comment
+            if fields: # Merge the base fields in one shot
+                self.data.update(fields)
+
         clz = NodeInterface if interface == 'node_interface'\
             else SingleNodeInterface
         
@@ -1517,15 +1825,16 @@ class Layer3PhysicalInterface(PhysicalInterface):
     
             _interface = []
             if_mgt = {k: str(v) == str(_interface_id) for k, v in mgt.items()}
-            
+            # outgoing/auth_request follow primary mgt and are constant
+            # across nodes, so merge them into the template once
+            if_mgt.update(
+                outgoing=True if if_mgt.get('primary_mgt') else False,
+                auth_request=True if if_mgt.get('primary_mgt') else False)
+
             for node in interface.pop('nodes', []):
-                _node = if_mgt.copy() # Each node should be treated independently
-                _node.update(
-                    outgoing=True if if_mgt.get('primary_mgt') else False,
-                    auth_request=True if if_mgt.get('primary_mgt') else False)
-                # Add node specific key/value pairs set on the node. This can
-                # also be used to override management settings
-                _node.update(node)
+                # Each node is treated independently. Node specific
+                # key/value pairs can also override management settings
+                _node = dict(if_mgt, **node)
                 ndi = clz.create(
                     interface_id=_interface_id, **_node)
                 _interface.append({ndi.typeof: ndi.data})
@@ -1622,21 +1931,24 @@ class ClusterPhysicalInterface(PhysicalInterface):
         _kw = copy.deepcopy(kw) # Preserve original kw, especially lists
         mgt = mgt if mgt else {}
         
+        fields = {}
         if 'cvi_mode' in _kw:
-            self.data.update(cvi_mode=_kw.pop('cvi_mode'))
-        
+            fields['cvi_mode'] = _kw.pop('cvi_mode')
+
         if 'macaddress' in _kw:
-            self.data.update(
-                macaddress=_kw.pop('macaddress'))
-            if 'cvi_mode' not in self.data:
-                self.data.update(cvi_mode='packetdispatch')
-        
+            fields['macaddress'] = _kw.pop('macaddress')
+            if 'cvi_mode' not in fields and 'cvi_mode' not in self.data:
+                fields['cvi_mode'] = 'packetdispatch'
+
         if 'zone_ref' in _kw:
             zone_ref = _kw.pop('zone_ref')
-            self.data.update(zone_ref=zone_helper(zone_ref) if zone_ref else None)
-        
+            fields['zone_ref'] = zone_helper(zone_ref) if zone_ref else None
+
         if 'comment' in _kw:
-            self.data.update(comment=_kw.pop('comment'))
+            fields['comment'] = _kw.pop('comment')
+
+        if fields: # Merge the base fields in one shot
+            self.data.update(fields)
 
         interfaces = _kw.pop('interfaces', [])
         for interface in interfaces:
@@ -1659,12 +1971,12 @@ class ClusterPhysicalInterface(PhysicalInterface):
                       
                     _interface.append({cvi.typeof: cvi.data})
     
+            # outgoing follows primary mgt and is constant across nodes
+            if_mgt.update(outgoing=True if if_mgt.get('primary_mgt') else False)
             for node in interface.pop('nodes', []):
-                _node = if_mgt.copy()
-                _node.update(outgoing=True if if_mgt.get('primary_mgt') else False)
-                # Add node specific key/value pairs set on the node. This can
-                # also be used to override management settings
-                _node.update(node)
+                # Each node is treated independently. Node specific
+                # key/value pairs can also override management settings
+                _node = dict(if_mgt, **node)
                 ndi = NodeInterface.create(
                     interface_id=_interface_id, **_node)
                 _interface.append({ndi.typeof: ndi.data})
@@ -1720,8 +2032,10 @@ class ClusterPhysicalInterface(PhysicalInterface):
         self.data['macaddress'] = value
   
     def __str__(self):
-        return '{}(name={})'.format(self.__class__.__name__, self.name
-            if self.name else 'Interface %s' % self.interface_id)
+        # name resolves through the element meta; fetch it once
+        name = self.name
+        return '{}(name={})'.format(self.__class__.__name__, name
+            if name else 'Interface %s' % self.interface_id)
 
 
 class VlanInterface(object):
@@ -1755,25 +2069,35 @@ class VlanInterface(object):
         
         :return: None
         """
-        if self in self._parent.vlan_interface:
-            self._parent.data['vlanInterfaces'] = [
-                v for v in self._parent.vlan_interface
-                if v != self]
-            self.update()
-            for route in self._parent._engine.routing:
-                if route.to_delete:
-                    route.delete()
+        # Scan the raw VLAN entries so the common idempotent miss is a
+        # pure dict walk and never round trips to the SMC; the single
+        # matching entry is deleted in place rather than rebuilding
+        # the list around it
+        vlans = self._parent.data.get('vlanInterfaces', [])
+        vlan_id = self.data.get('interface_id')
+        index = next((idx for idx, vlan in enumerate(vlans)
+            if vlan.get('interface_id') == vlan_id), None)
+        if index is None:
+            return
+        del vlans[index]
+        self.update()
+        routing = self._parent._engine.routing
+        stale = [route for route in routing if route.to_delete]
+        if stale:
+            routing.bulk_delete(stale)
     
     def update(self, **kw):
         if kw:
             self.data.update(**kw)
         self._parent.update()
     
-    @property
+    @cached_property
     def vlan_id(self):
         """
-        Vlan id for this vlan
-        
+        Vlan id for this vlan. The id is fixed for the life of the
+        wrapper so the string parse is cached; change_vlan_id drops
+        the cached value when it rewrites the interface_id.
+
         :rtype: str
         """
         return self.data.get('interface_id').split('.')[-1]
@@ -1789,10 +2113,27 @@ class VlanInterface(object):
         :raises UpdateElementFailed: failed to update the VLAN id
         :return: None
         """
+        # Coerce once and patch the raw sub interface dicts in place
+        # rather than re-stringifying per element through the wrappers
+        vlan_str = str(vlan_id)
+        newvlan = vlan_str.split('-')
         intf_id, _ = self.interface_id.split('.')
-        self.interface_id = '{}.{}'.format(intf_id, vlan_id)
-        for interface in self.interfaces:
-            interface.change_vlan_id(vlan_id)
+        self.interface_id = '{}.{}'.format(intf_id, vlan_str)
+        # The VLAN suffixes are loop invariant; concatenating them onto
+        # the interface halves beats re-formatting all parts per nicid
+        left = '.%s-' % newvlan[0]
+        right = '.%s' % newvlan[-1]
+        plain = '.%s' % vlan_str
+        for intf in self.data.get('interfaces', []):
+            for typeof, sub in intf.items():
+                nicid = str(sub.get('nicid', ''))
+                if typeof in _inline_typeofs:
+                    match = _inline_nicid.match(nicid)
+                    sub['nicid'] = \
+                        match.group(1) + left + match.group(2) + right
+                else:
+                    sub['nicid'] = nicid.split('.')[0] + plain
+        self.__dict__.pop('vlan_id', None)
         self.update()
 
 
@@ -1819,9 +2160,6 @@ class AllInterfaces(BaseIterable):
         SubInterfaceCollection)
     :rtype: SubInterface or VlanInterface
     """
-    def __init__(self, interfaces):
-        super(AllInterfaces, self).__init__(interfaces)
-    
     def __iter__(self):
         for it in self.items:
             for element in it:
@@ -1867,10 +2205,29 @@ class VlanCollection(BaseIterable):
     :rtype: BaseIterable
     """
     def __init__(self, interface):
-        name = '{}Vlan'.format(type(interface).__name__)
-        data = [type(name, (VlanInterface, interface.__class__), {
-                'data': ElementCache(vlan), '_parent': interface})()
-                for vlan in interface.data.get('vlanInterfaces', [])]
+        # Build the dynamic VLAN class once per collection; creating a
+        # new type per VLAN element is far more expensive than the
+        # instances themselves on interfaces with many VLANs. Built
+        # lazily on the first entry so collections on an interface that
+        # is itself a dynamic VLAN wrapper (always empty; VLANs do not
+        # nest) never attempt bases that already include VlanInterface
+        clz = None
+        data = []
+        # Index by VLAN id alongside the list so get_vlan is a dict
+        # probe instead of an O(n) scan per lookup; setdefault keeps
+        # the first match precedence of the scan it replaces
+        by_vlan_id = {}
+        for vlan in interface.data.get('vlanInterfaces', []):
+            if clz is None:
+                clz = type('{}Vlan'.format(type(interface).__name__),
+                    (VlanInterface, interface.__class__), {})
+            vlan_itf = clz()
+            vlan_itf.data = ElementCache(vlan)
+            vlan_itf._parent = interface
+            data.append(vlan_itf)
+            by_vlan_id.setdefault(
+                str(vlan.get('interface_id', '')).split('.')[-1], vlan_itf)
+        self._by_vlan_id = by_vlan_id
         super(VlanCollection, self).__init__(data)
     
     @property
@@ -1881,7 +2238,11 @@ class VlanCollection(BaseIterable):
         :return: list of VLANs by ID
         :rtype: list
         """
-        return [vlan.vlan_id for vlan in self]
+        # Read the raw VLAN entries rather than going through the
+        # vlan_id property of each wrapper; the ids are one field deep
+        # and callers typically only want a membership check
+        return [str(vlan.data.get('interface_id', '')).split('.')[-1]
+            for vlan in self]
     
     def get_vlan(self, *args, **kwargs):
         """
@@ -1904,9 +2265,14 @@ class VlanCollection(BaseIterable):
         if args:
             kwargs = {'vlan_id': str(args[0])}
         key, value = kwargs.popitem()
-        for vlan in self:
-            if getattr(vlan, key, None) == value:
+        if key == 'vlan_id':
+            vlan = self._by_vlan_id.get(str(value))
+            if vlan is not None:
                 return vlan
+        else:
+            for vlan in self:
+                if getattr(vlan, key, None) == value:
+                    return vlan
         raise InterfaceNotFound('VLAN ID {} was not found on this engine.'
             .format(value))
         
@@ -1926,6 +2292,10 @@ class VlanCollection(BaseIterable):
         if args:
             kwargs = {'vlan_id': str(args[0])}
         key, value = kwargs.popitem()
+        if key == 'vlan_id':
+            vlan = self._by_vlan_id.get(str(value))
+            if vlan is not None:
+                return vlan
         for item in self:
             if 'vlan_id' in key and getattr(item, key, None) == value:
                 return item
@@ -1934,15 +2304,45 @@ class VlanCollection(BaseIterable):
                     return item
                 
 
+def get_interface_editor(engine):
+    """
+    Return the engines shared InterfaceEditor, creating it on first
+    use. Collections and interface options previously built a new
+    editor per access which defeated the serialization memo; a single
+    editor per engine keeps it effective while the engine data cache
+    identity check still invalidates after updates.
+
+    :param Engine engine: engine reference
+    :rtype: InterfaceEditor
+    """
+    editor = getattr(engine, '_interface_editor', None)
+    if editor is None:
+        editor = engine._interface_editor = InterfaceEditor(engine)
+    return editor
+
+
 class InterfaceEditor(object):
     def __init__(self, engine):
         self.engine = engine
-    
+        self._serialized = None # (engine data cache, interfaces, id index)
+        self._mgmt_cache = None # (engine data cache, {mgmt: interface_id})
+
     def extract_self(self, link_list):
         for keys in link_list:
             if keys.get('rel') =='self':
                 return keys.get('href')
     
+    @cached_property
+    def _is_cluster(self):
+        # Engine type is fixed for the engine lifetime; probe once
+        return 'cluster' in self.engine.type
+
+    @cached_property
+    def _auth_request_disabled(self):
+        # master/layer2/ips engines never take an auth request
+        engine_type = self.engine.type
+        return any(t in engine_type for t in ('master', 'layer2', 'ips'))
+
     def serialize(self):
         for interface in self.engine.data.get('physicalInterfaces', []):
             for typeof, data in interface.items():
@@ -1951,12 +2351,12 @@ class InterfaceEditor(object):
                     clz = Layer2PhysicalInterface
                 else:
                     if typeof == 'physical_interface':
-                        if 'cluster' in self.engine.type:
+                        if self._is_cluster:
                             clz = ClusterPhysicalInterface
                         else:
                             clz = Layer3PhysicalInterface
                     else:
-                        clz = lookup_class(typeof, Interface)
+                        clz = _resolve_class(typeof)
 
                 clazz = clz(meta=dict(
                     name=data.get('name', 'Interface %s' % data.get('interface_id')),
@@ -1967,9 +2367,37 @@ class InterfaceEditor(object):
                 clazz._engine = self.engine
                 yield clazz
 
+    def _wrappers(self):
+        # Serialized interfaces are memoized against the engines cached
+        # data so back to back reads (i.e. each interface_options
+        # property) do not rebuild every wrapper. The engine update and
+        # delete paths drop the data cache which invalidates this too.
+        # Wrappers reference the engine json directly so modifications
+        # through a memoized wrapper are still seen by the engine.
+        # An id index is built alongside so `get` is a dict lookup; ids
+        # register in serialization order with setdefault to keep the
+        # first match precedence of the old linear scan.
+        data = self.engine.data
+        cached = self._serialized
+        if cached is None or cached[0] is not data:
+            interfaces = list(self.serialize())
+            index = {}
+            setdefault = index.setdefault
+            for intf in interfaces:
+                setdefault(str(intf.data.get('interface_id')), intf)
+                for sub in intf.data.get('interfaces', []):
+                    for typeof, subdata in sub.items():
+                        if typeof in _inline_typeofs:
+                            nicid = str(subdata.get('nicid', ''))
+                            setdefault(nicid, intf)
+                            for half in nicid.split('-'):
+                                setdefault(half, intf)
+            cached = self._serialized = (data, interfaces, index)
+        return cached
+
     def __iter__(self):
-        return self.serialize()
-    
+        return iter(self._wrappers()[1])
+
     def __len__(self):
         return len(self.engine.data.get('physicalInterfaces'))
 
@@ -1983,15 +2411,34 @@ class InterfaceEditor(object):
         
         :return: str interface_id
         """
-        for intf in self:
-            for allitf in intf.all_interfaces:
-                if isinstance(allitf, VlanInterface):
-                    for vlan in allitf.interfaces:
-                        if getattr(vlan, mgmt, None):
-                            return allitf.interface_id
-                else:
-                    if getattr(allitf, mgmt, None):
-                        return intf.interface_id
+        # Each interface_options property lands here, so read the
+        # engine json directly rather than serializing an interface
+        # wrapper per physical interface for a single flag. Results are
+        # memoized per engine data cache; set_unset/set_auth_request
+        # are the in-process writers of these flags and drop the memo
+        # whenever they modify anything
+        data = self.engine.data
+        cached = self._mgmt_cache
+        if cached is None or cached[0] is not data:
+            cached = self._mgmt_cache = (data, {})
+        elif mgmt in cached[1]:
+            return cached[1][mgmt]
+        result = self._find_mgmt_interface(mgmt)
+        cached[1][mgmt] = result
+        return result
+
+    def _find_mgmt_interface(self, mgmt):
+        for intf in self.engine.data.get('physicalInterfaces', []):
+            for data in intf.values():
+                for vlan in data.get('vlanInterfaces', []):
+                    for sub in vlan.get('interfaces', []):
+                        for subdata in sub.values():
+                            if subdata.get(mgmt):
+                                return vlan.get('interface_id')
+                for sub in data.get('interfaces', []):
+                    for subdata in sub.values():
+                        if subdata.get(mgmt):
+                            return data.get('interface_id')
     
     def get(self, interface_id):
         """
@@ -2000,30 +2447,22 @@ class InterfaceEditor(object):
         :param str interface_id: interface ID to find
         :raises InterfaceNotFound: Cannot find interface
         """
-        # From within engine, skips nested iterators for this find
-        # Make sure were dealing with a string
+        # From within engine, skips nested iterators for this find.
+        # Plain and inline ids resolve through the memoized index;
+        # make sure were dealing with a string
         interface_id = str(interface_id)
-        for intf in self:
-            if intf.interface_id == interface_id:
-                intf._engine = self.engine
-                return intf
-            else: # Check for inline interfaces
-                if '.' in interface_id:
-                    # It's a VLAN interface
-                    vlan = interface_id.split('.')
-                    # Check that we're on the right interface
-                    if intf.interface_id == vlan[0]:
-                        if intf.has_vlan:
-                            return intf.vlan_interface.get_vlan(vlan[-1])
-
-                elif intf.has_interfaces:
-                    for interface in intf.interfaces:
-                        if isinstance(interface, InlineInterface):
-                            split_intf = interface.nicid.split('-')
-                            if interface_id == interface.nicid or \
-                                str(interface_id) in split_intf:
-                                intf._engine = self.engine
-                                return intf
+        index = self._wrappers()[2]
+        intf = index.get(interface_id)
+        if intf is not None:
+            intf._engine = self.engine
+            return intf
+
+        if '.' in interface_id:
+            # It's a VLAN interface; find the parent by prefix
+            vlan = interface_id.split('.')
+            intf = index.get(vlan[0])
+            if intf is not None and intf.has_vlan:
+                return intf.vlan_interface.get_vlan(vlan[-1])
 
         raise InterfaceNotFound(
             'Interface id {} was not found on this engine.'.format(interface_id))
@@ -2037,6 +2476,8 @@ class InterfaceEditor(object):
         :raises InterfaceNotFound: raise if specified address does not exist or
             if the interface is not supported for this management role (i.e. you
             cannot set primary mgt to a CVI interface with no nodes).
+        :return: whether any interface value was modified
+        :rtype: bool
         """
         interface = self.get(interface_id) if interface_id is not None else None
         if address is not None:
@@ -2048,23 +2489,61 @@ class InterfaceEditor(object):
             if not target_network:
                 raise InterfaceNotFound('Address specified: %s was not found on interface '
                     '%s' % (address, interface_id))
-        
-        for interface in self:
-            all_subs = interface.sub_interfaces()
-            for sub_interface in all_subs:
-                # Skip VLAN only interfaces (no addresses)
-                if not isinstance(sub_interface, (VlanInterface, InlineInterface)):
-                    if getattr(sub_interface, attribute) is not None:
-                        if sub_interface.nicid == str(interface_id):
-                            if address is not None:
-                                if sub_interface.network_value == target_network:
-                                    sub_interface[attribute] = True
-                                else:
-                                    sub_interface[attribute] = False
-                            else:
-                                sub_interface[attribute] = True
-                        else: #unset
-                            sub_interface[attribute] = False
+
+        target_id = str(interface_id)
+
+        def set_or_unset(typeof, sub):
+            # Inline pairs and VLAN shells carry no addresses; only
+            # write when the value differs so callers can skip the
+            # engine update on no-op changes
+            if typeof in _inline_typeofs or sub.get(attribute) is None:
+                return False
+            if sub.get('nicid') == target_id:
+                if address is not None:
+                    value = sub.get('network_value') == target_network
+                else:
+                    value = True
+            else: #unset
+                value = False
+            if sub[attribute] != value:
+                sub[attribute] = value
+                return True
+            return False
+
+        # Walk the raw engine json once; building sub interface
+        # wrappers per interface just to flip one boolean is the
+        # dominant cost on engines with many interfaces
+        changed = False
+        for intf in self.engine.data.get('physicalInterfaces', []):
+            for data in intf.values():
+                for vlan in data.get('vlanInterfaces', []):
+                    for sub in vlan.get('interfaces', []):
+                        for typeof, subdata in sub.items():
+                            changed |= set_or_unset(typeof, subdata)
+                for sub in data.get('interfaces', []):
+                    for typeof, subdata in sub.items():
+                        changed |= set_or_unset(typeof, subdata)
+        if changed:
+            self._invalidate_mgmt_memos()
+        return changed
+
+    def _invalidate_mgmt_memos(self):
+        # Writers of the management booleans mutate the sub interface
+        # dicts in place, which the engine data identity checks cannot
+        # see; drop the find_mgmt_interface memo and the per wrapper
+        # _mgmt_flags summaries cached by _serialized so reads through
+        # an already handed out wrapper see the new flags. The dynamic
+        # VLAN wrappers inherit the same summary, so any memoized VLAN
+        # collections are swept too
+        self._mgmt_cache = None
+        cached = self._serialized
+        if cached is not None:
+            for intf in cached[1]:
+                intf.__dict__.pop('_mgmt_flags', None)
+                vlans = getattr(intf, '_vlan_collection', None)
+                if vlans is not None:
+                    for vlan in vlans[2]:
+                        vlan.__dict__.pop('_mgmt_flags', None)
 
     def set_auth_request(self, interface_id, address=None):
         """
@@ -2073,49 +2552,79 @@ class InterfaceEditor(object):
         set on an interface with a CVI (not valid on NDI only cluster
         interfaces).
         If this is a cluster interface, address should be CVI IP.
+
+        :return: whether any interface value was modified
+        :rtype: bool
         """
-        for engine_type in ['master', 'layer2', 'ips']:
-            if engine_type in self.engine.type:
-                return
-        
+        if self._auth_request_disabled:
+            return False
+
         interface = self.get(interface_id)
-        if 'cluster' in self.engine.type:
+        # Each all_interfaces access rebuilds the sub interface
+        # collections; partition the target subs in a single pass so
+        # the CVI check and both write branches below reuse the same
+        # isinstance results
+        cvis, others = [], []
+        for itf in interface.all_interfaces:
+            if isinstance(itf, ClusterVirtualInterface):
+                cvis.append(itf)
+            else:
+                others.append(itf)
+        if self._is_cluster:
             # Auth request on a cluster interface must have at least a CVI.
             # It cannot bind to NDI only interfaces
-            if not any(isinstance(itf, ClusterVirtualInterface)
-                       for itf in interface.all_interfaces):
+            if not cvis:
                 raise InterfaceNotFound('The interface specified: %s does not have '
                     'a CVI interface defined and therefore cannot be used as an '
                     'interface for auth_requests. If setting the primary_mgt interface '
                     'provide an interface id for auth_request.' % interface_id)
-        
+
         current_interface = self.get(
             self.engine.interface_options.auth_request)
-        for itf in current_interface.all_interfaces:
+        current_subs = current_interface.all_interfaces
+        # Snapshot the flags so an idempotent call (interface already
+        # holds auth request) reports no change back to the caller
+        def flags():
+            return [bool(getattr(itf, 'auth_request', False))
+                    for itf in current_subs] + \
+                   [bool(getattr(itf, 'auth_request', False))
+                    for itf in cvis] + \
+                   [bool(getattr(itf, 'auth_request', False))
+                    for itf in others]
+        before = flags()
+        for itf in current_subs:
             if getattr(itf, 'auth_request', False):
                 itf['auth_request'] = False
         # Set
-        sub_if = interface.all_interfaces
-        if any(isinstance(itf, ClusterVirtualInterface) for itf in sub_if):
-            for itf in sub_if:
-                if isinstance(itf, ClusterVirtualInterface):
-                    if address:
-                        if getattr(itf, 'address', None) == address:
-                            itf['auth_request'] = True
-                    else:
+        if cvis:
+            for itf in cvis:
+                if address:
+                    if getattr(itf, 'address', None) == address:
                         itf['auth_request'] = True
+                else:
+                    itf['auth_request'] = True
         else:
-            for itf in sub_if:
+            for itf in others:
                 if getattr(itf, 'auth_request', None) is not None:
                     if address:
                         if getattr(itf, 'address', None) == address:
                             itf['auth_request'] = True
                     else:
                         itf['auth_request'] = True
+        changed = flags() != before
+        if changed:
+            self._invalidate_mgmt_memos()
+        return changed
 
 
 def extract_sub_interface(data):
+    # Only the first sub interface entry matters; probe the module
+    # level typeof -> class table built at import time directly rather
+    # than paying a function call per extraction
     for intf in data.get('interfaces', []):
         for if_type, values in intf.items():
-            return get_sub_interface(if_type)(values)
+            clz = _sub_interface_map.get(if_type)
+            if clz is not None:
+                return clz(values)
+            return None
 
@@ -131,6 +131,8 @@ def flush_parent_cache(node):
     and a clean way to force the object to update itself
     if attributes or methods are referenced after update.
     """
+    if node is None: # Updating from the root routing node
+        return
     if node._parent is None:
         node._del_cache()
         return
@@ -263,7 +265,32 @@ class RoutingTree(SubElement):
     def delete(self):
         super(RoutingTree, self).delete()
         flush_parent_cache(self._parent)
-        
+
+    def bulk_delete(self, nodes):
+        """
+        Delete multiple child nodes of this routing node with a single
+        update. Each individual :meth:`delete` is its own HTTP round
+        trip; when removing many stale routes below one node it is
+        cheaper to prune the children from this nodes configuration
+        and submit one request::
+
+            interface = engine.routing.get(0)
+            interface.bulk_delete([network for network in interface
+                                   if network.ip != '1.1.1.0/24'])
+
+        :param list nodes: child nodes of this routing node, i.e. as
+            obtained by iterating this level
+        :raises UpdateElementFailed: failure to update with reason
+        :return: None
+        """
+        doomed = set(id(node.data.data) for node in nodes)
+        if not doomed:
+            return
+        children = self.data[self.typeof]
+        children[:] = [child for child in children
+                       if id(child) not in doomed]
+        self.update()
+
     def update(self):
         super(RoutingTree, self).update()
         flush_parent_cache(self._parent)
@@ -638,7 +665,7 @@ class Routing(RoutingTree):
                             is_valid_destination = False
                             if destination not in existing_dests:
                                 dest_ipv4, dest_ipv6 = _which_ip_protocol(destination)
-                                if len(network.ip.split(':')) > 1: # IPv6
+                                if ':' in network.ip: # IPv6
                                     if dest_ipv6:
                                         is_valid_destination = True
                                 else:
@@ -653,7 +680,7 @@ class Routing(RoutingTree):
         
             else: # Gateway doesn't exist
                 gw_ipv4, gw_ipv6 = _which_ip_protocol(gateway_element_type) # ipv4, ipv6 or both
-                if len(network.ip.split(':')) > 1:
+                if ':' in network.ip:
                     if gw_ipv6:
                         network.data.setdefault('routing_node', []).append(
                             routing_node_gateway)
@@ -948,16 +975,21 @@ def del_invalid_routes(engine, nicids):
     :param list nicids: list of nicids
     :raises DeleteElementFailed: delete element failed with reason
     """
-    nicids = map(str, nicids)
+    # Set for hashed membership tests; a py3 map object would also be
+    # exhausted by the first `in` check below
+    nicids = set(map(str, nicids))
     for interface in engine.routing:
         if interface.nicid in nicids:
             if getattr(interface, 'to_delete', False): # Delete the invalid interface
                 interface.delete()
                 continue
-        for network in interface:
-            if getattr(network, 'invalid', False) or \
-                getattr(network, 'to_delete', False):
-                network.delete()
+        # Coalesce invalid networks below this interface into one update
+        # instead of a round trip per deleted route
+        invalid = [network for network in interface
+                   if getattr(network, 'invalid', False) or
+                   getattr(network, 'to_delete', False)]
+        if invalid:
+            interface.bulk_delete(invalid)
 
 
 route = collections.namedtuple('Route',
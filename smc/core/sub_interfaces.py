@@ -12,8 +12,7 @@ from smc.api.exceptions import EngineCommandFailed
 
 
 def get_sub_interface(typeof):
-    if typeof in clsmembers:
-        return clsmembers[typeof]
+    return clsmembers.get(typeof)
 
     
 class SubInterfaceCollection(BaseIterable):
@@ -28,9 +27,8 @@ class SubInterfaceCollection(BaseIterable):
         
 
 class SubInterface(NestedDict):
-    def __init__(self, data):
-        super(SubInterface, self).__init__(data=data)
-    
+    __slots__ = ()
+
     def change_interface_id(self, interface_id):
         """
         Generic change interface ID for VLAN interfaces that are not
@@ -72,10 +70,8 @@ class ClusterVirtualInterface(SubInterface):
 
     """
     typeof = 'cluster_virtual_interface'
+    __slots__ = ()
 
-    def __init__(self, data):
-        super(ClusterVirtualInterface, self).__init__(data)
-            
     @classmethod
     def create(cls, interface_id, address, network_value,
                **kwargs):
@@ -90,8 +86,7 @@ class ClusterVirtualInterface(SubInterface):
                 'nicid': str(interface_id),
                 'auth_request': False}
 
-        for k, v in kwargs.items():
-            data.update({k: v})
+        data.update(kwargs)
 
         return cls(data)
 
@@ -107,12 +102,13 @@ class ClusterVirtualInterface(SubInterface):
         if nicid:
             v = nicid.split('.')
             if len(v) > 1:
-                return nicid.split('.')[1]
+                return v[1]
 
     def __repr__(self):
-        if self.vlan_id:
+        vlan_id = self.vlan_id
+        if vlan_id:
             return '{0}(address={1}, vlan_id={2})'.format(
-                self.__class__.__name__, self.address, self.vlan_id)
+                self.__class__.__name__, self.address, vlan_id)
         else:
             return '{0}(address={1})'.format(
                 self.__class__.__name__, self.address)
@@ -136,9 +132,7 @@ class InlineInterface(SubInterface):
     :ivar str zone_ref (optional): zone for second interface in pair
     """
     typeof = 'inline_interface'
-
-    def __init__(self, data):
-        super(InlineInterface, self).__init__(data)
+    __slots__ = ()
 
     @classmethod
     def create(cls, interface_id, logical_interface_ref,
@@ -155,8 +149,7 @@ class InlineInterface(SubInterface):
                 'logical_interface_ref': logical_interface_ref,
                 'zone_ref': zone_ref}
 
-        for k, v in kwargs.items():
-            data.update({k: v})
+        data.update(kwargs)
 
         return cls(data)
     
@@ -214,8 +207,9 @@ class InlineInterface(SubInterface):
         if nicids:
             u = []
             for vlan in nicids:
-                if vlan.split('.')[-1] not in u:
-                    u.append(vlan.split('.')[-1])
+                vlan_id = vlan.split('.')[-1]
+                if vlan_id not in u:
+                    u.append(vlan_id)
             return '-'.join(u)
 
     def __repr__(self):
@@ -234,10 +228,7 @@ class InlineIPSInterface(InlineInterface):
         Requires SMC 6.3.
     """
     typeof = 'inline_ips_interface'
-    
-    def __init__(self, data):
-        super(InlineIPSInterface, self).__init__(data)
-    
+    __slots__ = ()
 
 class InlineL2FWInterface(InlineInterface):
     """
@@ -250,10 +241,8 @@ class InlineL2FWInterface(InlineInterface):
         Requires SMC 6.3.
     """
     typeof = 'inline_l2fw_interface'
-    
-    def __init__(self, data):
-        super(InlineL2FWInterface, self).__init__(data)
-    
+    __slots__ = ()
+
     @classmethod
     def create(cls, interface_id, logical_interface_ref,
             second_interface_id=None, zone_ref=None, **kwargs):
@@ -276,10 +265,8 @@ class CaptureInterface(SubInterface):
     :ivar str,int nicid: nicid for this capture interface
     """
     typeof = 'capture_interface'
+    __slots__ = ()
 
-    def __init__(self, data):
-        super(CaptureInterface, self).__init__(data)
-        
     @classmethod
     def create(cls, interface_id, logical_interface_ref, **kw):
         """
@@ -354,9 +341,7 @@ class NodeInterface(SubInterface):
     :ivar int vrrp_priority: The VRRP Priority. Required only for VRRP mode
     """
     typeof = 'node_interface'
-
-    def __init__(self, data):
-        super(NodeInterface, self).__init__(data)
+    __slots__ = ()
 
     @classmethod
     def create(cls, interface_id, address, network_value,
@@ -378,8 +363,7 @@ class NodeInterface(SubInterface):
                 'primary_mgt': False,
                 'primary_heartbeat': False}
 
-        for k, v in kwargs.items():
-            data.update({k: v})
+        data.update(kwargs)
 
         return cls(data)
     
@@ -395,12 +379,13 @@ class NodeInterface(SubInterface):
         if nicid:
             v = nicid.split('.')
             if len(v) > 1:
-                return nicid.split('.')[1]
+                return v[1]
 
     def __repr__(self):
-        if self.vlan_id:
+        vlan_id = self.vlan_id
+        if vlan_id:
             return '{0}(address={1}, vlan_id={2})'.format(
-                self.__class__.__name__, self.address, self.vlan_id)
+                self.__class__.__name__, self.address, vlan_id)
         else:
             return '{0}(address={1})'.format(
                 self.__class__.__name__, self.address)
@@ -418,9 +403,7 @@ class SingleNodeInterface(NodeInterface):
         be automatically created for this dynamic interface. Used in DHCP interfaces only
     """
     typeof = 'single_node_interface'
-
-    def __init__(self, data):
-        super(SingleNodeInterface, self).__init__(data)
+    __slots__ = ()
 
     @classmethod
     def create(cls, interface_id, address=None, network_value=None,
@@ -445,8 +428,7 @@ class SingleNodeInterface(NodeInterface):
                 'outgoing': False,
                 'primary_mgt': False}
         
-        for k, v in kw.items():
-            data.update({k: v})
+        data.update(kw)
         
         if 'dynamic' in kw and kw['dynamic'] is not None:
             for key in ('address', 'network_value'):
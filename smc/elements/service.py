@@ -15,6 +15,21 @@ from smc.elements.protocols import ProtocolAgentMixin
 from smc.base.util import element_resolver
 
 
+def _port_service_json(name, min_dst_port, max_dst_port, min_src_port,
+        max_src_port, protocol_agent, comment):
+    """
+    Shared payload build for the port range based services (TCP/UDP);
+    both element types serialize the same fields.
+    """
+    return {'name': name,
+            'min_dst_port': min_dst_port,
+            'max_dst_port': max_dst_port if max_dst_port is not None else '',
+            'min_src_port': min_src_port,
+            'max_src_port': max_src_port,
+            'protocol_agent_ref': element_resolver(protocol_agent) or None,
+            'comment': comment}
+
+
 class TCPService(ProtocolAgentMixin, Element):
     """ 
     Represents a TCP based service in SMC
@@ -54,14 +69,8 @@ class TCPService(ProtocolAgentMixin, Element):
         :return: instance with meta
         :rtype: TCPService
         """
-        max_dst_port = max_dst_port if max_dst_port is not None else ''
-        json = {'name': name,
-                'min_dst_port': min_dst_port,
-                'max_dst_port': max_dst_port,
-                'min_src_port': min_src_port,
-                'max_src_port': max_src_port,
-                'protocol_agent_ref': element_resolver(protocol_agent) or None,
-                'comment': comment}
+        json = _port_service_json(name, min_dst_port, max_dst_port,
+            min_src_port, max_src_port, protocol_agent, comment)
 
         return ElementCreator(cls, json)
 
@@ -104,14 +113,8 @@ class UDPService(ProtocolAgentMixin, Element):
         :return: instance with meta
         :rtype: UDPService
         """
-        max_dst_port = max_dst_port if max_dst_port is not None else ''
-        json = {'name': name,
-                'min_dst_port': min_dst_port,
-                'max_dst_port': max_dst_port,
-                'min_src_port': min_src_port,
-                'max_src_port': max_src_port,
-                'protocol_agent_ref': element_resolver(protocol_agent) or None,
-                'comment': comment}
+        json = _port_service_json(name, min_dst_port, max_dst_port,
+            min_src_port, max_src_port, protocol_agent, comment)
 
         return ElementCreator(cls, json)
 
@@ -101,9 +101,6 @@ class NATValue(NestedDict):
     :ivar str min_port: min port for this translation
     :ivar str max_port: max port for this translation  
     """
-    def __init__(self, values):
-        super(NATValue, self).__init__(data=values)
-     
     @property
     def as_element(self):
         if 'element' in self:
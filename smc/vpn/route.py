@@ -389,7 +389,9 @@ class TunnelEndpoint(object):
         endpoint
     """
     gateway = ElementRef('gateway_ref')
-    
+    __slots__ = ('gateway_ref', 'tunnel_interface_ref',
+                 'endpoint_ref', 'ip_address')
+
     def __init__(self, gateway_ref=None, tunnel_interface_ref=None,
                  endpoint_ref=None, ip_address=None):
         self.gateway_ref = gateway_ref
@@ -487,7 +489,11 @@ class TunnelEndpoint(object):
     
     @property
     def data(self):
-        return {k: v for k, v in vars(self).items() if v}
+        # Serialize only the set reference fields; with __slots__ there
+        # is no instance dict for vars() to expose
+        return {attr: value for attr, value in
+                ((attr, getattr(self, attr)) for attr in self.__slots__)
+                if value}
     
     @property
     def remote_address(self):